@@ -7,7 +7,7 @@ import json
 import threading
 import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from models import DownloadTask, VideoInfo, DownloadStatus
 
 
@@ -76,6 +76,41 @@ class QueueManager:
             self.queue.append(task)
             return task
     
+    def add_tasks(self, video_infos: List[VideoInfo], download_path: str = "") -> Tuple[int, int]:
+        """
+        Add multiple download tasks to the queue in one operation (thread-safe).
+        
+        The lock is acquired once and duplicates are detected with a single
+        pass over the queue, so adding large playlists does not rescan the
+        queue for every entry. URLs repeated within the batch are also skipped.
+        
+        Args:
+            video_infos: VideoInfo objects to add.
+            download_path: Path where the videos will be downloaded.
+        
+        Returns:
+            Tuple of (number of tasks added, number of duplicates skipped).
+        """
+        with self._queue_lock:
+            seen_urls = {task.video_info.url for task in self.queue}
+            added_count = 0
+            duplicate_count = 0
+            
+            for video_info in video_infos:
+                if video_info.url in seen_urls:
+                    duplicate_count += 1
+                    continue
+                
+                seen_urls.add(video_info.url)
+                self.queue.append(DownloadTask(
+                    id=str(uuid.uuid4()),
+                    video_info=video_info,
+                    download_path=download_path
+                ))
+                added_count += 1
+            
+            return added_count, duplicate_count
+    
     def remove_task(self, task_id: str) -> bool:
         """
         Remove a task from the queue (thread-safe).
@@ -1915,12 +1915,15 @@ class SearchManager:
             self.platform_health_cache[platform_name] = (time.time(), status)
             return status
     
-    def check_all_platforms_health(self) -> Dict[str, str]:
+    def check_all_platforms_health(self, max_workers: int = 8) -> Dict[str, str]:
         """
         Check health of all categorized platforms.
         Runs checks in parallel using ThreadPoolExecutor.
         Results are cached with 1-hour TTL.
         
+        Args:
+            max_workers: Maximum number of platforms probed concurrently.
+        
         Returns:
             Dictionary mapping platform name to health status.
             Example: {'YouTube': 'healthy', 'Bilibili': 'healthy', 'SoundCloud': 'unknown'}
@@ -1944,30 +1947,35 @@ class SearchManager:
                 self.logger.error(f"Unexpected error checking {platform_name}: {e}")
                 return platform_name, "unknown"
         
-        # Execute parallel health checks using ThreadPoolManager search_pool
+        # Execute parallel health checks on a dedicated, bounded executor.
+        # The shared search_pool only has 3 workers, which serialized most of
+        # the probes and blocked user searches while a health check ran.
         health_results = {}
         
-        executor = self._thread_pool_manager.search_pool
-        # Submit all platform health checks
-        future_to_platform = {
-            executor.submit(check_single_platform, platform): platform
-            for platform in all_platforms
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_platform):
-            try:
-                platform_name, status = future.result()
-                health_results[platform_name] = status
-                
-                # Log progress
-                if len(health_results) % 5 == 0:
-                    self.logger.info(f"Checked {len(health_results)}/{len(all_platforms)} platforms")
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(all_platforms))),
+            thread_name_prefix="health-check"
+        ) as executor:
+            # Submit all platform health checks
+            future_to_platform = {
+                executor.submit(check_single_platform, platform): platform
+                for platform in all_platforms
+            }
+            
+            # Collect results as they complete
+            for future in as_completed(future_to_platform):
+                try:
+                    platform_name, status = future.result()
+                    health_results[platform_name] = status
                     
-            except Exception as e:
-                platform = future_to_platform[future]
-                self.logger.error(f"Unexpected error processing {platform}: {e}")
-                health_results[platform] = "unknown"
+                    # Log progress
+                    if len(health_results) % 5 == 0:
+                        self.logger.info(f"Checked {len(health_results)}/{len(all_platforms)} platforms")
+                        
+                except Exception as e:
+                    platform = future_to_platform[future]
+                    self.logger.error(f"Unexpected error processing {platform}: {e}")
+                    health_results[platform] = "unknown"
         
         # Log summary
         healthy_count = sum(1 for status in health_results.values() if status == "healthy")
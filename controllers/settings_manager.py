@@ -157,6 +157,19 @@ class SettingsManager:
         with self._cache_lock:
             return self._settings_cache.get(key, default)
     
+    def snapshot(self) -> dict:
+        """
+        Get a copy of all settings in one call (thread-safe).
+        
+        Useful when reading many keys at once, e.g. to populate a settings
+        form, instead of taking the lock once per get().
+        
+        Returns:
+            Shallow copy of the current settings dictionary.
+        """
+        with self._cache_lock:
+            return dict(self._settings_cache)
+    
     def set(self, key: str, value) -> None:
         """
         Set a setting value and save (thread-safe).
@@ -175,6 +188,31 @@ class SettingsManager:
                 if old_value != value:
                     self._publish_settings_changed([key])
     
+    def update(self, values: dict) -> None:
+        """
+        Set several setting values and save once (thread-safe).
+        
+        Unlike calling set() for each key, the settings file is written a
+        single time and one SETTINGS_CHANGED event lists every key whose
+        value actually changed.
+        
+        Args:
+            values: Mapping of setting keys to new values.
+        """
+        if not values:
+            return
+        
+        with self._cache_lock:
+            changed_keys = [
+                key for key, value in values.items()
+                if self._settings_cache.get(key) != value
+            ]
+            self._settings_cache.update(values)
+            
+            # Save to disk
+            if self.save_settings() and changed_keys:
+                self._publish_settings_changed(changed_keys)
+    
     def _publish_settings_changed(self, changed_keys: list) -> None:
         """
         Publish SETTINGS_CHANGED event.
@@ -122,6 +122,11 @@ class ThemeManager:
                         borderwidth=0)
         style.map("Treeview", background=[("selected", "#37373d")]) # VS Code selection color
         
+        # Named text styles; configured here so they survive theme_use()
+        style.configure("Title.TLabel", font=("Segoe UI", 20, "bold"))
+        style.configure("Body.TLabel", font=("Segoe UI", 10))
+        style.configure("Status.TLabel", font=("Segoe UI", 10), foreground=self.EMERALD_GREEN)
+        
         # Notebook styling
         style.configure("TNotebook", background=bg, borderwidth=0)
         style.configure("TNotebook.Tab", background=sec_bg, foreground=fg, padding=[10, 5], borderwidth=0)
@@ -392,6 +392,10 @@ class KlypVideoDownloader(ttk.Window):
         if hasattr(self, 'search_screen') and hasattr(self.search_screen, 'search_manager'):
             self.search_screen.search_manager.shutdown()
         
+        # Log out of the subtitle provider session
+        if hasattr(self, 'subtitles_screen'):
+            self.subtitles_screen.shutdown()
+        
         # Shutdown ThreadPoolManager
         info("Shutting down ThreadPoolManager")
         thread_pool_manager = ThreadPoolManager()
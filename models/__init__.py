@@ -1,5 +1,5 @@
 """Data models for the OK.ru video downloader application."""
 
-from .data_models import VideoInfo, DownloadTask, DownloadHistory, DownloadStatus
+from .data_models import VideoInfo, DownloadTask, DownloadHistory, DownloadStatus, SearchResult
 
-__all__ = ["VideoInfo", "DownloadTask", "DownloadHistory", "DownloadStatus"]
+__all__ = ["VideoInfo", "DownloadTask", "DownloadHistory", "DownloadStatus", "SearchResult"]
@@ -5,7 +5,7 @@ Defines VideoInfo, DownloadTask, and DownloadHistory structures.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from enum import Enum
 
 
@@ -123,6 +123,39 @@ class SearchResult:
             raise ValueError("URL cannot be empty")
         if not self.url.startswith(("http://", "https://")):
             raise ValueError("URL must start with http:// or https://")
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SearchResult':
+        """
+        Create a SearchResult from a search manager result dictionary.
+        
+        Keys that are not fields are ignored; missing descriptive fields
+        fall back to placeholder values.
+        
+        Args:
+            data: Result dictionary as returned by SearchManager.
+        
+        Returns:
+            SearchResult instance.
+        
+        Raises:
+            ValueError: If the result has no valid URL.
+        """
+        values = {
+            "id": "",
+            "url": "",
+            "title": "Unknown",
+            "author": "Unknown",
+            "duration": "Unknown",
+            "thumbnail": "",
+            "platform": "Unknown",
+            "platform_category": "",
+            "platform_icon": "",
+            "platform_color": "",
+        }
+        field_names = cls.__dataclass_fields__
+        values.update((key, value) for key, value in data.items() if key in field_names)
+        return cls(**values)
 
 
 @dataclass
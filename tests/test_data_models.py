@@ -1,11 +1,11 @@
 """
 Unit tests for data models.
-Tests VideoInfo, DownloadTask, and DownloadHistory.
+Tests VideoInfo, DownloadTask, DownloadHistory, and SearchResult.
 """
 
 import unittest
 from datetime import datetime
-from models import VideoInfo, DownloadTask, DownloadHistory, DownloadStatus
+from models import VideoInfo, DownloadTask, DownloadHistory, DownloadStatus, SearchResult
 
 
 class TestVideoInfo(unittest.TestCase):
@@ -118,5 +118,38 @@ class TestDownloadHistory(unittest.TestCase):
             )
 
 
+class TestSearchResult(unittest.TestCase):
+    """Test cases for SearchResult model."""
+    
+    def test_from_dict(self):
+        """Test creating a SearchResult from a search result dictionary."""
+        result = SearchResult.from_dict({
+            "url": "https://www.youtube.com/watch?v=abc",
+            "title": "Test Video",
+            "platform": "YouTube",
+            "view_count": 1500,
+            "tags": ["music"],
+            "unknown_key": "ignored"
+        })
+        self.assertEqual(result.title, "Test Video")
+        self.assertEqual(result.platform, "YouTube")
+        self.assertEqual(result.view_count, 1500)
+        self.assertEqual(result.tags, ["music"])
+        self.assertFalse(result.enrichment_failed)
+    
+    def test_from_dict_defaults(self):
+        """Test that missing fields fall back to placeholder values."""
+        result = SearchResult.from_dict({"url": "https://ok.ru/video/123456"})
+        self.assertEqual(result.title, "Unknown")
+        self.assertEqual(result.author, "Unknown")
+        self.assertIsNone(result.view_count)
+        self.assertEqual(result.available_qualities, [])
+    
+    def test_from_dict_without_url_raises_error(self):
+        """Test that a result without URL raises ValueError."""
+        with self.assertRaises(ValueError):
+            SearchResult.from_dict({"title": "No URL"})
+
+
 if __name__ == "__main__":
     unittest.main()
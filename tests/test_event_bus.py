@@ -120,6 +120,33 @@ class TestEventBus(unittest.TestCase):
         result = self.event_bus.unsubscribe("nonexistent-id")
         self.assertFalse(result)
     
+    def test_unsubscribe_many(self):
+        """Test unsubscribing several IDs in one call."""
+        received_events = []
+        
+        def callback(event):
+            received_events.append(event)
+        
+        sub_ids = [
+            self.event_bus.subscribe(EventType.DOWNLOAD_FAILED, callback),
+            self.event_bus.subscribe(EventType.DOWNLOAD_FAILED, callback),
+            self.event_bus.subscribe(EventType.SEARCH_COMPLETE, callback),
+        ]
+        
+        # Unknown IDs are ignored and not counted
+        removed = self.event_bus.unsubscribe_many(sub_ids + ["nonexistent-id"])
+        self.assertEqual(removed, 3)
+        
+        event = Event(
+            type=EventType.DOWNLOAD_FAILED,
+            data={"task_id": "test-789", "error": "Network error"}
+        )
+        self.event_bus._dispatch_event(event)
+        self.assertEqual(len(received_events), 0)
+        
+        # Already removed IDs are not found again
+        self.assertEqual(self.event_bus.unsubscribe_many(sub_ids), 0)
+    
     def test_process_events_with_mock_root(self):
         """Test process_events method with mock tkinter root."""
         received_events = []
@@ -16,12 +16,18 @@ class TestQueueManager(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        # QueueManager is a process-wide singleton; start every test empty
         self.queue_manager = QueueManager()
+        self.queue_manager.clear_queue()
         self.video_info = VideoInfo(
             url="https://ok.ru/video/123456",
             title="Test Video"
         )
     
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.queue_manager.clear_queue()
+    
     def test_add_task(self):
         """Test adding a task to the queue."""
         task = self.queue_manager.add_task(self.video_info)
@@ -34,6 +40,36 @@ class TestQueueManager(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.queue_manager.add_task(self.video_info)
     
+    def test_add_tasks(self):
+        """Test adding several tasks to the queue at once."""
+        video_infos = [
+            VideoInfo(url="https://ok.ru/video/400001", title="Episode 1"),
+            VideoInfo(url="https://ok.ru/video/400002", title="Episode 2"),
+        ]
+        
+        added, duplicates = self.queue_manager.add_tasks(video_infos, download_path="/tmp/downloads")
+        
+        self.assertEqual(added, 2)
+        self.assertEqual(duplicates, 0)
+        tasks = self.queue_manager.get_all_tasks()
+        self.assertEqual(len(tasks), 2)
+        self.assertTrue(all(task.download_path == "/tmp/downloads" for task in tasks))
+    
+    def test_add_tasks_skips_duplicates(self):
+        """Test that add_tasks skips URLs already queued or repeated in the batch."""
+        self.queue_manager.add_task(self.video_info)
+        video_infos = [
+            VideoInfo(url=self.video_info.url),
+            VideoInfo(url="https://ok.ru/video/400003"),
+            VideoInfo(url="https://ok.ru/video/400003"),
+        ]
+        
+        added, duplicates = self.queue_manager.add_tasks(video_infos)
+        
+        self.assertEqual(added, 1)
+        self.assertEqual(duplicates, 2)
+        self.assertEqual(len(self.queue_manager.get_all_tasks()), 2)
+    
     def test_remove_task(self):
         """Test removing a task from the queue."""
         task = self.queue_manager.add_task(self.video_info)
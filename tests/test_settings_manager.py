@@ -6,6 +6,7 @@ Tests settings persistence and management.
 import unittest
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 from controllers import SettingsManager
 
 
@@ -63,6 +64,44 @@ class TestSettingsManager(unittest.TestCase):
         self.assertEqual(new_manager.get_theme(), "light")
         self.assertEqual(new_manager.get_download_mode(), "multi-threaded")
 
+    def test_snapshot_returns_copy(self):
+        """Test that snapshot() returns all settings without exposing the cache."""
+        snapshot = self.settings_manager.snapshot()
+        self.assertEqual(snapshot["theme"], self.settings_manager.get_theme())
+        self.assertIn("download_directory", snapshot)
+        
+        snapshot["theme"] = "modified"
+        self.assertNotEqual(self.settings_manager.get_theme(), "modified")
+    
+    def test_update_saves_once(self):
+        """Test that update() sets several values with a single save."""
+        with patch.object(self.settings_manager, "save_settings", return_value=True) as mock_save:
+            self.settings_manager.update({
+                "proxy_host": "127.0.0.1",
+                "proxy_port": "8080",
+            })
+        
+        mock_save.assert_called_once()
+        self.assertEqual(self.settings_manager.get("proxy_host"), "127.0.0.1")
+        self.assertEqual(self.settings_manager.get("proxy_port"), "8080")
+    
+    def test_update_publishes_one_event(self):
+        """Test that update() publishes a single event listing only changed keys."""
+        current_type = self.settings_manager.get("proxy_type")
+        with patch("utils.event_bus.EventBus.publish") as mock_publish:
+            self.settings_manager.update({
+                "proxy_host": "10.0.0.1",
+                "proxy_port": "3128",
+                "proxy_type": current_type,
+            })
+            mock_publish.assert_called_once()
+            event = mock_publish.call_args[0][0]
+            self.assertEqual(sorted(event.data["changed_keys"]), ["proxy_host", "proxy_port"])
+            
+            # Saving the same values again publishes nothing
+            self.settings_manager.update({"proxy_host": "10.0.0.1", "proxy_port": "3128"})
+            mock_publish.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
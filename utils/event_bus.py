@@ -10,7 +10,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 import uuid
 
 from utils.logger import get_logger
@@ -245,6 +245,42 @@ class EventBus:
             
             return found
     
+    def unsubscribe_many(self, sub_ids: Iterable[str]) -> int:
+        """
+        Unsubscribe several subscription IDs at once.
+        
+        Takes the lock once and filters each listener list in a single pass,
+        instead of one lock acquisition and full scan per unsubscribe() call.
+        
+        Args:
+            sub_ids: Subscription IDs returned by subscribe()
+        
+        Returns:
+            Number of subscriptions that were found and removed
+        """
+        to_remove = set(sub_ids)
+        if not to_remove:
+            return 0
+        
+        with self._lock:
+            removed = 0
+            for event_type, listeners in list(self._listeners.items()):
+                remaining = [(sid, cb) for sid, cb in listeners if sid not in to_remove]
+                removed += len(listeners) - len(remaining)
+                # Clean up empty listener lists
+                if remaining:
+                    self._listeners[event_type] = remaining
+                else:
+                    del self._listeners[event_type]
+            
+            self._logger.debug(f"Unsubscribed {removed} of {len(to_remove)} subscription(s)")
+            if removed < len(to_remove):
+                self._logger.warning(
+                    f"{len(to_remove) - removed} subscription ID(s) not found"
+                )
+            
+            return removed
+    
     def process_events(self, root: tk.Tk) -> None:
         """
         Process pending events in UI thread.
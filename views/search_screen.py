@@ -4,9 +4,17 @@ Provides video search functionality.
 """
 
 # Standard library imports
+import concurrent.futures
+import functools
 import logging
+import queue
+import re
 import threading
+import time
 import tkinter as tk
+from collections import Counter
+from datetime import datetime
+from types import MappingProxyType
 from tkinter import messagebox
 
 # Third-party imports
@@ -15,7 +23,7 @@ from ttkbootstrap.constants import *
 
 # Local imports
 from controllers.search_manager import SearchManager
-from models import VideoInfo, DownloadStatus
+from models import VideoInfo, DownloadStatus, SearchResult
 from utils.advanced_search_panel import AdvancedSearchPanel
 from utils.batch_compare_dialog import BatchCompareDialog
 from utils.event_bus import EventBus, Event, EventType
@@ -26,6 +34,88 @@ from utils.safe_callback_mixin import SafeCallbackMixin
 from utils.series_dialog import SeriesDetectionDialog
 
 
+# Number of result rows inserted into the treeview per render pass
+RESULTS_PAGE_SIZE = 50
+
+# Date formats for yt-dlp upload dates and their display form
+UPLOAD_DATE_FORMAT = "%Y%m%d"
+DISPLAY_DATE_FORMAT = "%b %d, %Y"
+
+# Filter labels mapped to search_manager time limit and duration values
+TIMELIMIT_MAP = {"Any": None, "Day": "d", "Week": "w", "Month": "m", "Year": "y"}
+DURATION_MAP = {"Any": None, "Short": "short", "Medium": "medium", "Long": "long"}
+
+# Seconds a platform health result is reused without probing the platforms again
+HEALTH_CACHE_TTL = 60.0
+
+# Platforms shown with health indicators in the domain filter
+_BASE_PLATFORMS = ("All", "YouTube", "Vimeo", "Dailymotion", "OK.ru")
+
+# Domain filter labels mapped to the site passed to the search manager
+_PLATFORM_DOMAIN_MAP = MappingProxyType({
+    "YouTube": "youtube.com",
+    "Vimeo": "vimeo.com",
+    "Dailymotion": "dailymotion.com",
+    "OK.ru": "ok.ru",
+    "Rumble": "rumble.com",
+    "Bilibili": "bilibili.com",
+    "Niconico": "nicovideo.jp",
+    "Crunchyroll": "crunchyroll.com",
+    "SoundCloud": "soundcloud.com",
+    "Bandcamp": "bandcamp.com",
+    "Audiomack": "audiomack.com",
+    "Mixcloud": "mixcloud.com",
+    "TikTok": "tiktok.com",
+    "Instagram": "instagram.com",
+    "Twitter": "twitter.com",
+    "Reddit": "reddit.com",
+    "Twitch": "twitch.tv",
+    "Spotify": "spotify.com"
+})
+
+# Translation table that deletes health indicator icons from domain labels
+HEALTH_ICON_STRIP_TABLE = str.maketrans("", "", "".join(PlatformHealthIndicator.STATUS_ICONS.values()))
+
+# Generic playlist markers checked for any host
+_GENERIC_PLAYLIST_MARKERS = r"playlist|album|collection"
+GENERIC_PLAYLIST_RE = re.compile(_GENERIC_PLAYLIST_MARKERS, re.IGNORECASE)
+
+# Host -> playlist markers for that host alone, plus the generic markers
+_HOST_PLAYLIST_MARKERS = {
+    "youtube.com": r"list=|/playlist",
+    "youtu.be": r"list=|/playlist",
+    "vimeo.com": r"/showcase/|/album/|/channels/",
+    "dailymotion.com": r"/playlist/",
+    "soundcloud.com": r"/sets/",
+}
+PLAYLIST_RE_BY_HOST = MappingProxyType({
+    host: re.compile(f"{markers}|{_GENERIC_PLAYLIST_MARKERS}", re.IGNORECASE)
+    for host, markers in _HOST_PLAYLIST_MARKERS.items()
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _clean_domain(value):
+    """
+    Map a domain filter entry to the site passed to the search manager.
+    
+    Args:
+        value: Raw combobox text, possibly prefixed with a health indicator icon.
+    
+    Returns:
+        Domain string, or None for "All", category separators and unknown entries.
+    """
+    # Remove health indicator icons if present
+    domain_value = value.translate(HEALTH_ICON_STRIP_TABLE).strip()
+    
+    # Skip category separators
+    if domain_value.startswith("---") or domain_value == "All":
+        return None
+    
+    # Map platform names to domains
+    return _PLATFORM_DOMAIN_MAP.get(domain_value)
+
+
 class SearchScreen(SafeCallbackMixin, ttk.Frame):
     """Search screen with search input and results display."""
     
@@ -46,13 +136,61 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         self.search_results = []
         self.logger = logging.getLogger("Klyp.SearchScreen")
         self.expanded_items = {}  # Track expanded items and their metadata tooltips
+        self._item_id_to_index = {}  # Map tree item IDs to positions in search_results
+        self._rendered_count = 0  # Number of search_results currently inserted in the tree
         self.enrichment_enabled = False  # DISABLED by default to prevent freezing
         self.advanced_search_visible = False  # Track advanced search panel visibility
         self.advanced_panel = None  # Will hold the AdvancedSearchPanel instance
         self.trending_cache = {}  # Cache for trending results
         self.trending_cache_ttl = 900  # 15 minutes in seconds
+        self._health_cache = None  # Last platform health results
+        self._health_cache_ts = 0.0  # time.monotonic() when _health_cache was stored
+        self._health_check_inflight = False  # True while a health check thread is running
+        self._health_check_lock = threading.Lock()  # Guards _health_check_inflight
         self._subscription_ids = []  # Track event subscriptions for cleanup
+        self._alive = threading.Event()  # Cleared on cleanup/destroy; polled by worker threads
+        self._alive.set()
+        self._progress_start_id = None  # Pending delayed start of the progress animation
+        self._domain_values = None  # Values last pushed to the domain filter combobox
+        self._status_text = None  # Text last written to the status label by _set_status
+        
+        # Platform substring -> tree icon, checked in order; anything else gets the web icon
+        icons = app.icons
+        self._platform_icons = (
+            ("youtube", icons.get("youtube_logo")),
+            ("ok.ru", icons.get("okru_logo")),
+            ("vimeo", icons.get("vimeo_logo")),
+        )
+        self._default_icon = icons.get("web_logo")
+        
+        # App hooks used after queueing videos; the queue screen is created
+        # after this screen, so its refresh hook is resolved on first use
+        self._save_pending = getattr(app, 'save_pending_downloads', None)
+        self._refresh_queue = None
+        
+        # Persistent pool for format extraction, reused across "Add to Queue" clicks
+        self._format_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="fmt-fetch"
+        )
+        
+        # Persistent pool for searches, enrichment, comparisons and health checks
+        self._bg_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="SearchBG"
+        )
+        
+        # Worker threads post (callback, args) pairs here; a single timer on the
+        # main thread drains them instead of scheduling one Tk timer per result
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_pump_id = None
         self.setup_ui()
+        
+        # Tcl command and widget paths for labels updated on every search/compare/health event
+        self._tk_call = self.tk.call
+        self._status_path = str(self.status_label)
+        self._progress_path = str(self.progress_label)
+        self._ui_pump_id = self.after(50, self._drain_ui_queue)
     
     def setup_ui(self):
         """Set up the search screen UI."""
@@ -159,6 +297,22 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         )
         self.domain_combo.pack(side=LEFT)
         
+        # Platform health refresh; repeat clicks within HEALTH_CACHE_TTL reuse the
+        # last check, shift-click always probes the platforms again
+        self.health_refresh_btn = ttk.Button(
+            filters_frame,
+            text="🔄",
+            command=self.refresh_platform_health,
+            bootstyle="secondary-outline",
+            width=3
+        )
+        self.health_refresh_btn.bind(
+            "<Shift-Button-1>",
+            lambda e: (self.refresh_platform_health(force=True), "break")[1]
+        )
+        if self.app.settings_manager.get("search_show_platform_health", True):
+            self.health_refresh_btn.pack(side=LEFT, padx=(5, 0))
+        
         # Platform health status cache
         self.platform_health_status = {}
         
@@ -225,10 +379,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             self.logger.info(f"Received SEARCH_COMPLETE event for query: {query}")
             # Update UI with search results
             self.display_results(results)
-            self.status_label.config(
-                text=f"Search complete: {len(results)} result(s) found",
-                foreground="#10b981"
-            )
+            self._set_status(f"Search complete: {len(results)} result(s) found", "#10b981")
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in _on_search_complete_event: {e}")
@@ -244,10 +395,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             
             self.logger.error(f"Received SEARCH_FAILED event for query: {query}, error: {error}")
             # Update UI with error
-            self.status_label.config(
-                text=f"Search failed: {error}",
-                foreground="#ef4444"
-            )
+            self._set_status(f"Search failed: {error}", "#ef4444")
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in _on_search_failed_event: {e}")
@@ -289,19 +437,20 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         list_container.pack(fill=BOTH, expand=YES)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(list_container, bootstyle="round")
+        self.results_scrollbar = ttk.Scrollbar(list_container, bootstyle="round")
         
         # Results treeview - removed "category" column
+        # Scroll updates go through _on_results_scroll so rows can be rendered on demand
         self.results_tree = ttk.Treeview(
             list_container,
             columns=("expand", "title", "author", "duration", "platform"),
             show="tree headings",
             selectmode=BROWSE,
-            yscrollcommand=scrollbar.set
+            yscrollcommand=self._on_results_scroll
         )
         self.results_tree.pack(side=LEFT, fill=BOTH, expand=YES)
-        scrollbar.pack(side=RIGHT, fill=Y)
-        scrollbar.config(command=self.results_tree.yview)
+        self.results_scrollbar.pack(side=RIGHT, fill=Y)
+        self.results_scrollbar.config(command=self.results_tree.yview)
         
         # Configure columns
         self.results_tree.column("#0", width=40, stretch=NO)
@@ -402,19 +551,13 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             return
         
         # Show loading status
-        self.status_label.config(text=f"Fetching available qualities for '{title}'...", foreground="#3498db")
+        self._set_status(f"Fetching available qualities for '{title}'...", "#3498db")
         
         # Run metadata fetch in background thread
-        threading.Thread(
-            target=self._fetch_formats_and_add,
-            args=(url, title),
-            daemon=True
-        ).start()
+        self._submit_bg(self._fetch_formats_and_add, url, title)
     
     def _load_trending_with_cache(self):
         """Load trending content with 15-minute cache."""
-        from datetime import datetime
-        
         # Check if we have cached trending results
         current_category = self.trending_panel.current_category
         cache_key = f"trending_{current_category}"
@@ -442,14 +585,10 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             return
         
         # Show loading status
-        self.status_label.config(text=f"Fetching available qualities for '{title}'...", foreground="#3498db")
+        self._set_status(f"Fetching available qualities for '{title}'...", "#3498db")
         
         # Run metadata fetch in background thread
-        threading.Thread(
-            target=self._fetch_formats_and_add,
-            args=(url, title),
-            daemon=True
-        ).start()
+        self._submit_bg(self._fetch_formats_and_add, url, title)
     
     def perform_search(self):
         """Perform video search in background."""
@@ -474,17 +613,16 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         
         # UI Updates
         self.clear_results()
-        self.status_label.config(text=f"Searching for: {query}...", foreground="#10b981")
+        self._set_status(f"Searching for: {query}...", "#10b981")
         self.search_button.config(state="disabled")
         self.search_entry.config(state="disabled")
         
         # Run search in thread
-        import threading
-        threading.Thread(
-            target=self._perform_search_thread, 
-            args=(query, region, timelimit, duration, site, content_type, min_quality, format_type, use_advanced, operators_config), 
-            daemon=True
-        ).start()
+        self._submit_bg(
+            self._perform_search_thread,
+            query, region, timelimit, duration, site, content_type,
+            min_quality, format_type, use_advanced, operators_config
+        )
     
     def search_with_preset(self, preset_name):
         """Perform search using a content preset."""
@@ -499,10 +637,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             return
         
         # Update status
-        self.status_label.config(
-            text=f"Searching {preset_name} platforms...",
-            foreground="#10b981"
-        )
+        self._set_status(f"Searching {preset_name} platforms...", "#10b981")
         
         # Clear previous results
         self.clear_results()
@@ -510,12 +645,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         self.search_entry.config(state="disabled")
         
         # Run preset search in thread
-        import threading
-        threading.Thread(
-            target=self._preset_search_worker,
-            args=(preset_name, query),
-            daemon=True
-        ).start()
+        self._submit_bg(self._preset_search_worker, preset_name, query)
     
     def _preset_search_worker(self, preset_name, query):
         """Background worker for preset search."""
@@ -537,11 +667,11 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 self.logger.debug("Widget destroyed during preset search, skipping callback")
                 return
             
-            self.safe_after(0, lambda r=results: self._on_search_complete(r))
+            self.safe_after(0, self._on_search_complete, results)
         except Exception as e:
             # Check if widget is still alive before scheduling error callback
             if not self.is_destroyed():
-                self.safe_after(0, lambda err=e: self._on_search_error(str(err)))
+                self.safe_after(0, self._on_search_error, str(e))
     def _perform_search_thread(self, query, region, timelimit, duration, site, content_type, min_quality=None, format_type=None, use_advanced=False, operators_config=None):
         """Perform search in background thread."""
         try:
@@ -595,11 +725,11 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 return
             
             # Schedule UI update on main thread
-            self.safe_after(0, lambda r=results, q=query: self._on_search_complete(r, q))
+            self.safe_after(0, self._on_search_complete, results, query)
         except Exception as e:
             # Check if widget is still alive before scheduling error callback
             if not self.is_destroyed():
-                self.safe_after(0, lambda err=e: self._on_search_error(str(err)))
+                self.safe_after(0, self._on_search_error, str(e))
             
     def _on_search_complete(self, results, query=None):
         """Handle search completion on main thread."""
@@ -612,24 +742,14 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             # Users can enable it in settings if they want metadata
             if self.enrichment_enabled and results:
                 self.logger.info("Metadata enrichment is enabled, starting background enrichment")
-                self.status_label.config(
-                    text=f"Found {len(results)} result(s). Enriching metadata...",
-                    foreground="#10b981"
-                )
+                self._set_status(f"Found {len(results)} result(s). Enriching metadata...", "#10b981")
                 # Show progress bar for enrichment
                 self.show_progress(f"Enriching metadata for {len(results)} results...")
                 
-                threading.Thread(
-                    target=self._enrich_results_thread,
-                    args=(results,),
-                    daemon=True
-                ).start()
+                self._submit_bg(self._enrich_results_thread, results)
             else:
                 # Just show results count without enrichment
-                self.status_label.config(
-                    text=f"Found {len(results)} result(s)",
-                    foreground="#10b981"
-                )
+                self._set_status(f"Found {len(results)} result(s)", "#10b981")
             
             # Check for series detection if query is provided
             if query:
@@ -646,7 +766,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         try:
             self.search_button.config(state="normal")
             self.search_entry.config(state="normal")
-            self.status_label.config(text=f"Error: {error_msg}", foreground="#ef4444")
+            self._set_status(f"Error: {error_msg}", "#ef4444")
             messagebox.showerror("Search Error", f"Search failed: {error_msg}")
         except tk.TclError as e:
             # Widget was destroyed - ignore
@@ -671,12 +791,12 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 return
             
             # Update search_results with enriched data
-            self.safe_after(0, lambda r=enriched_results: self._on_enrichment_complete(r))
+            self.safe_after(0, self._on_enrichment_complete, enriched_results)
         except Exception as e:
             self.logger.error(f"Enrichment failed: {e}")
             # Check if widget is still alive before scheduling error callback
             if not self.is_destroyed():
-                self.safe_after(0, lambda: self._on_enrichment_error(str(e)))
+                self.safe_after(0, self._on_enrichment_error, str(e))
     
     def _on_enrichment_complete(self, enriched_results):
         """Handle enrichment completion on main thread."""
@@ -684,22 +804,21 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             # Hide progress bar
             self.hide_progress()
             
-            # Update search_results with enriched data
-            self.search_results = enriched_results
+            # Update search_results with enriched data, keeping the displayed row
+            # order (enrichment returns results in completion order)
+            enriched_by_url = {r.url: r for r in self._to_search_results(enriched_results)}
+            self.search_results = [enriched_by_url.get(r.url, r) for r in self.search_results]
             
             # Count successful enrichments
             successful = sum(1 for r in enriched_results if not r.get('enrichment_failed', True))
             
-            self.status_label.config(
-                text=f"Found {len(enriched_results)} result(s). Metadata enriched for {successful} videos.",
-                foreground="#10b981"
+            self._set_status(
+                f"Found {len(enriched_results)} result(s). Metadata enriched for {successful} videos.",
+                "#10b981"
             )
             
             # Auto-hide status after 5 seconds
-            self.safe_after(5000, lambda: self._safe_update_status(
-                "Enter a search query to find videos",
-                "#888888"
-            ))
+            self.safe_after(5000, self._reset_status_label)
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in _on_enrichment_complete: {e}")
@@ -714,10 +833,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             self.hide_progress()
             
             self.logger.warning(f"Enrichment error: {error_msg}")
-            self.status_label.config(
-                text=f"Search complete. Metadata enrichment failed.",
-                foreground="#f59e0b"
-            )
+            self._set_status(f"Search complete. Metadata enrichment failed.", "#f59e0b")
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in _on_enrichment_error: {e}")
@@ -762,9 +878,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 
                 # Update expand indicator
                 if self.results_tree.exists(item_id):
-                    values = list(self.results_tree.item(item_id, "values"))
-                    values[0] = "▶"
-                    self.results_tree.item(item_id, values=values)
+                    self.results_tree.set(item_id, "expand", "▶")
             else:
                 # Expand: show metadata tooltip
                 self._show_metadata_for_item(item_id)
@@ -778,67 +892,62 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
     def _show_metadata_for_item(self, item_id):
         """Show metadata tooltip for a result item."""
         # Find the result data
-        item_index = self.results_tree.index(item_id)
+        item_index = self._item_id_to_index.get(item_id)
         
-        if item_index >= len(self.search_results):
+        if item_index is None or item_index >= len(self.search_results):
             return
         
         result = self.search_results[item_index]
         
         # Check if metadata is available
-        if not result.get('view_count') and not result.get('enrichment_failed'):
+        if not result.view_count and not result.enrichment_failed:
             # Metadata not yet enriched
-            self.status_label.config(
-                text="Metadata not yet available. Please wait for enrichment to complete.",
-                foreground="#f59e0b"
-            )
+            self._set_status("Metadata not yet available. Please wait for enrichment to complete.", "#f59e0b")
             return
         
-        # Create a child item with metadata tooltip
-        tooltip_id = self.results_tree.insert(
-            item_id,
-            END,
-            text="",
-            values=("", "", "", "", "", "")
-        )
+        # Create and display metadata tooltip
+        # Note: Treeview doesn't support embedding widgets directly,
+        # so we'll display metadata as text in a single child item
+        tooltip_id = self._display_metadata_as_text(item_id, result)
         
         # Store the tooltip reference
         self.expanded_items[item_id] = tooltip_id
         
         # Update expand indicator
-        values = list(self.results_tree.item(item_id, "values"))
-        values[0] = "▼"
-        self.results_tree.item(item_id, values=values)
-        
-        # Create and display metadata tooltip
-        # Note: Treeview doesn't support embedding widgets directly,
-        # so we'll display metadata as text in child items
-        self._display_metadata_as_text(tooltip_id, result)
+        self.results_tree.set(item_id, "expand", "▼")
     
-    def _display_metadata_as_text(self, tooltip_id, result):
-        """Display metadata as text in child tree items."""
+    def _display_metadata_as_text(self, item_id, result):
+        """
+        Display metadata as text in a single child tree item.
+        
+        Args:
+            item_id: Tree item of the result to expand.
+            result: SearchResult with the metadata.
+        
+        Returns:
+            ID of the inserted metadata item.
+        """
         metadata_lines = []
         
-        if result.get('enrichment_failed', False):
+        if result.enrichment_failed:
             metadata_lines.append("⚠️ Metadata unavailable")
         else:
             # Stats line
             stats_parts = []
-            view_count = result.get('view_count', 0)
+            view_count = result.view_count or 0
             if view_count > 0:
                 stats_parts.append(f"👁️ {self._format_number(view_count)} views")
             
-            like_count = result.get('like_count', 0)
+            like_count = result.like_count or 0
             if like_count > 0:
                 stats_parts.append(f"👍 {self._format_number(like_count)} likes")
             
-            upload_date = result.get('upload_date', '')
+            upload_date = result.upload_date
             if upload_date:
-                from datetime import datetime
                 try:
                     if len(upload_date) == 8:
-                        date_obj = datetime.strptime(upload_date, "%Y%m%d")
-                        formatted_date = date_obj.strftime("%b %d, %Y")
+                        date_obj = datetime.strptime(upload_date, UPLOAD_DATE_FORMAT)
+                        formatted_date = date_obj.strftime(DISPLAY_DATE_FORMAT)
                         stats_parts.append(f"📅 {formatted_date}")
                 except Exception:
                     pass
@@ -847,33 +956,34 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 metadata_lines.append(" | ".join(stats_parts))
             
             # Description
-            description = result.get('description', '')
+            description = result.description
             if description:
                 metadata_lines.append(f"Description: {description}")
             
             # Tags
-            tags = result.get('tags', [])
+            tags = result.tags
             if tags:
-                tags_str = ", ".join([f"🏷️ {tag}" for tag in tags])
+                tags_str = "🏷️ " + ", 🏷️ ".join(tags)
                 metadata_lines.append(f"Tags: {tags_str}")
             
             # Qualities
-            qualities = result.get('available_qualities', [])
+            qualities = result.available_qualities
             if qualities:
-                quality_str = ", ".join([f"{q}p" for q in qualities])
+                quality_str = ", ".join(f"{q}p" for q in qualities)
                 metadata_lines.append(f"🎬 Available: {quality_str}")
         
-        # Add each line as a child item
-        for line in metadata_lines:
-            self.results_tree.insert(
-                tooltip_id,
-                END,
-                text="",
-                values=("", "", line, "", "", "")
-            )
+        # Rows are single-line, so join the metadata into one title-column cell
+        return self.results_tree.insert(
+            item_id,
+            END,
+            text="",
+            values=("", " | ".join(metadata_lines), "", "", "")
+        )
     
-    def _format_number(self, num: int) -> str:
-        """Format large numbers with K, M, B suffixes."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_number(num: int) -> str:
+        """Format large numbers with K, M, B suffixes (cached, counts repeat often)."""
         if num >= 1_000_000_000:
             return f"{num / 1_000_000_000:.1f}B"
         elif num >= 1_000_000:
@@ -904,10 +1014,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
     
     def _search_all_episodes(self, base_query, series_info):
         """Search for all episodes in background."""
-        self.status_label.config(
-            text=f"Searching for all episodes of '{base_query}'...",
-            foreground="#10b981"
-        )
+        self._set_status(f"Searching for all episodes of '{base_query}'...", "#10b981")
         self.search_button.config(state="disabled")
         
         # Get current filters
@@ -915,11 +1022,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         site = self._get_clean_domain_value()
         
         # Run episode search in thread
-        threading.Thread(
-            target=self._search_episodes_thread,
-            args=(base_query, region, site, series_info),
-            daemon=True
-        ).start()
+        self._submit_bg(self._search_episodes_thread, base_query, region, site, series_info)
     
     def _search_episodes_thread(self, base_query, region, site, series_info):
         """Search for episodes in background thread."""
@@ -942,21 +1045,18 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 return
             
             if episodes:
-                self.safe_after(0, lambda eps=episodes, bq=base_query: self._show_series_dialog(eps, bq))
+                self.safe_after(0, self._show_series_dialog, episodes, base_query)
             else:
-                self.safe_after(0, lambda: self._on_no_episodes_found())
+                self.safe_after(0, self._on_no_episodes_found)
         except Exception as e:
             # Check if widget is still alive before scheduling error callback
             if not self.is_destroyed():
-                self.safe_after(0, lambda err=e: self._on_search_error(str(err)))
+                self.safe_after(0, self._on_search_error, str(e))
     
     def _show_series_dialog(self, episodes, base_query):
         """Show series detection dialog with found episodes."""
         self.search_button.config(state="normal")
-        self.status_label.config(
-            text=f"Found {len(episodes)} episode results",
-            foreground="#10b981"
-        )
+        self._set_status(f"Found {len(episodes)} episode results", "#10b981")
         
         # Show dialog
         dialog = SeriesDetectionDialog(self, episodes, base_query)
@@ -968,18 +1068,12 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         if selected_episodes:
             self._add_episodes_to_queue(selected_episodes, base_query)
         else:
-            self.status_label.config(
-                text="Series download cancelled",
-                foreground="#888888"
-            )
+            self._set_status("Series download cancelled", "#888888")
     
     def _on_no_episodes_found(self):
         """Handle case when no episodes are found."""
         self.search_button.config(state="normal")
-        self.status_label.config(
-            text="No additional episodes found",
-            foreground="#888888"
-        )
+        self._set_status("No additional episodes found", "#888888")
         messagebox.showinfo(
             "No Episodes Found",
             "Could not find additional episodes for this series.",
@@ -996,123 +1090,82 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         )
         
         if not dialog.result:
-            self.status_label.config(
-                text="Series download cancelled",
-                foreground="#888888"
-            )
+            self._set_status("Series download cancelled", "#888888")
             return
         
         selected_quality = dialog.result
         
-        # Add each episode to queue
-        added_count = 0
-        duplicate_count = 0
+        # Get download settings once for the whole series
+        download_path = self.app.settings_manager.get_download_directory()
+        subtitle_download = self.app.settings_manager.get("subtitle_download", False)
+        
+        # Episode searches often return the same URL more than once,
+        # so drop repeats before building VideoInfo objects
+        video_infos = []
+        seen_urls = set()
+        batch_duplicates = 0
         
         for episode in episodes:
             url = episode.get('url')
-            title = episode.get('title', 'Unknown')
-            
             if not url:
                 continue
+            if url in seen_urls:
+                batch_duplicates += 1
+                continue
+            seen_urls.add(url)
             
-            video_info = VideoInfo(
+            video_infos.append(VideoInfo(
                 url=url,
-                title=title,
+                title=episode.get('title', 'Unknown'),
                 selected_quality=selected_quality,
-                download_subtitles=self.app.settings_manager.get("subtitle_download", False)
+                download_subtitles=subtitle_download
+            ))
+        
+        # Add all episodes to queue in one operation
+        try:
+            added_count, duplicate_count = self.app.queue_manager.add_tasks(
+                video_infos,
+                download_path=download_path
             )
-            
-            try:
-                download_path = self.app.settings_manager.get_download_directory()
-                self.app.queue_manager.add_task(
-                    video_info=video_info,
-                    download_path=download_path
-                )
-                added_count += 1
-            except ValueError:
-                # Duplicate video
-                duplicate_count += 1
-                continue
-            except Exception as e:
-                self.logger.warning(f"Failed to add episode to queue: {e}")
-                continue
+        except Exception as e:
+            self.logger.warning(f"Failed to add episodes to queue: {e}")
+            added_count, duplicate_count = 0, 0
         
-        # Save pending downloads
-        if hasattr(self.app, 'save_pending_downloads'):
-            self.app.save_pending_downloads()
+        duplicate_count += batch_duplicates
         
-        # Refresh queue screen
-        if hasattr(self.app, 'queue_screen'):
-            self.app.queue_screen.refresh_queue()
+        # Save pending downloads and refresh queue screen
+        self._on_queue_changed()
         
         # Show success message
         msg = f"Added {added_count} episode(s) to queue"
         if duplicate_count > 0:
             msg += f" ({duplicate_count} duplicate(s) skipped)"
         
-        self.status_label.config(text=msg, foreground="#10b981")
-        self.safe_after(5000, lambda: self.status_label.config(
-            text="Enter a search query to find videos",
-            foreground="#888888"
-        ))
+        self._set_status(msg, "#10b981")
+        self.safe_after(5000, self._reset_status_label)
     
     def display_results(self, results):
         """
         Display search results in the treeview.
         
+        Only the first page of rows is inserted up front; further pages are
+        rendered by _on_results_scroll as the user scrolls towards the end.
+        
         Args:
             results: List of video result dictionaries.
         """
         try:
-            self.search_results = results
+            self.search_results = self._to_search_results(results)
             self.expanded_items = {}  # Clear expanded items
+            self._item_id_to_index = {}
+            self._rendered_count = 0
             
-            # Add results to treeview
-            for idx, result in enumerate(results, 1):
-                title = result.get("title", "Unknown")
-                author = result.get("author", "Unknown")
-                duration = result.get("duration", "Unknown")
-                platform = result.get("platform", "Unknown")
-                url = result.get("url", "")
-                
-                # Detect if URL might be a playlist
-                is_likely_playlist = self._is_playlist_url(url)
-                
-                # Add playlist indicator to title
-                if is_likely_playlist:
-                    title = f"📋 {title}"
-                
-                # Add available qualities to title if present
-                available_qualities = result.get("available_qualities", [])
-                if available_qualities:
-                    quality_str = ", ".join(available_qualities[:3])  # Show top 3 qualities
-                    title = f"{title} [{quality_str}]"
-                
-                # Map platform to icon for tree column
-                platform_lower = platform.lower()
-                if "youtube" in platform_lower:
-                    icon = self.app.icons.get("youtube_logo")
-                elif "ok.ru" in platform_lower:
-                    icon = self.app.icons.get("okru_logo")
-                elif "vimeo" in platform_lower:
-                    icon = self.app.icons.get("vimeo_logo")
-                else:
-                    icon = self.app.icons.get("web_logo")
-                
-                # Insert row without category column
-                item_id = self.results_tree.insert(
-                    "",
-                    END,
-                    text=f" {idx}",
-                    image=icon,
-                    values=("▶", title, author, duration, platform),
-                    tags=(url,)
-                )
+            self._render_next_results()
             
-            if results:
-                self.status_label.config(text=f"Found {len(results)} result(s)", foreground="#d4d4d4")
+            if self.search_results:
+                self._set_status(f"Found {len(self.search_results)} result(s)", "#d4d4d4")
             else:
-                self.status_label.config(text="No results found", foreground="#d4d4d4")
+                self._set_status("No results found", "#d4d4d4")
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in display_results: {e}")
@@ -1120,6 +1173,98 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             # Log other errors but don't crash
             self.logger.error(f"Error in display_results: {e}", exc_info=True)
     
+    def _to_search_results(self, results):
+        """
+        Convert result dictionaries to SearchResult objects.
+        
+        Results without a valid URL cannot be queued and are skipped.
+        
+        Args:
+            results: List of video result dictionaries.
+        
+        Returns:
+            List of SearchResult objects.
+        """
+        converted = []
+        for result in results:
+            try:
+                converted.append(SearchResult.from_dict(result))
+            except (ValueError, TypeError) as e:
+                self.logger.debug(f"Skipping invalid search result: {e}")
+        return converted
+    
+    def _render_next_results(self):
+        """Insert the next page of search results into the treeview."""
+        start = self._rendered_count
+        end = min(start + RESULTS_PAGE_SIZE, len(self.search_results))
+        
+        platform_icons = self._platform_icons
+        default_icon = self._default_icon
+        insert = self.results_tree.insert
+        
+        for idx in range(start, end):
+            result = self.search_results[idx]
+            url = result.url
+            platform = result.platform
+            
+            # Build the title from its parts in a single join
+            parts = []
+            
+            # Add playlist indicator to title
+            if self._is_playlist_url(url):
+                parts.append("📋 ")
+            
+            parts.append(result.title)
+            
+            # Add available qualities to title if present
+            available_qualities = result.available_qualities
+            if available_qualities:
+                parts.append(f" [{', '.join(available_qualities[:3])}]")  # Show top 3 qualities
+            
+            title = "".join(parts)
+            
+            # Map platform to icon for tree column
+            platform_lower = platform.lower()
+            icon = next(
+                (ic for key, ic in platform_icons if key in platform_lower),
+                default_icon
+            )
+            
+            # Insert row without category column
+            item_id = insert(
+                "",
+                END,
+                text=f" {idx + 1}",
+                image=icon,
+                values=("▶", title, result.author, result.duration, platform),
+                tags=(url,),
+                open=False
+            )
+            self._item_id_to_index[item_id] = idx
+        
+        self._rendered_count = end
+    
+    def _on_results_scroll(self, first, last):
+        """
+        Forward treeview scroll updates to the scrollbar and render more rows on demand.
+        
+        Args:
+            first: Fraction of the list above the visible area.
+            last: Fraction of the list up to the bottom of the visible area.
+        """
+        try:
+            self.results_scrollbar.set(first, last)
+            
+            # Render the next page once the viewport nears the last inserted row
+            if float(last) >= 0.9 and self._rendered_count < len(self.search_results):
+                self._render_next_results()
+        except tk.TclError as e:
+            # Widget was destroyed - ignore
+            self.logger.debug(f"TclError in _on_results_scroll: {e}")
+        except Exception as e:
+            # Log other errors but don't crash
+            self.logger.error(f"Error in _on_results_scroll: {e}", exc_info=True)
+    
     def _is_playlist_url(self, url: str) -> bool:
         """
         Check if URL is likely a playlist based on URL patterns.
@@ -1135,41 +1280,14 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         
         url_lower = url.lower()
         
-        # YouTube playlist patterns
-        if 'youtube.com' in url_lower or 'youtu.be' in url_lower:
-            if 'list=' in url_lower:
-                return True
-            if '/playlist' in url_lower:
-                return True
-        
-        # Vimeo patterns
-        if 'vimeo.com' in url_lower:
-            if '/showcase/' in url_lower:
-                return True
-            if '/album/' in url_lower:
-                return True
-            if '/channels/' in url_lower:
-                return True
-        
-        # Dailymotion patterns
-        if 'dailymotion.com' in url_lower:
-            if '/playlist/' in url_lower:
-                return True
-        
-        # SoundCloud patterns
-        if 'soundcloud.com' in url_lower:
-            if '/sets/' in url_lower:
-                return True
-        
-        # Generic patterns
-        if 'playlist' in url_lower:
-            return True
-        if 'album' in url_lower:
-            return True
-        if 'collection' in url_lower:
-            return True
-        
-        return False
+        # Reduce the host to its last two labels (www.youtube.com -> youtube.com)
+        host = url_lower.split('/', 3)[2] if '://' in url_lower else ''
+        host = '.'.join(host.split('.')[-2:])
+        
+        # Each host is only tested against its own markers; most results
+        # come from hosts without any and fall back to the generic ones
+        pattern = PLAYLIST_RE_BY_HOST.get(host, GENERIC_PLAYLIST_RE)
+        return pattern.search(url_lower) is not None
     
     def add_selected_to_queue(self, event=None):
         """Add selected video to queue with quality selection."""
@@ -1198,14 +1316,10 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             title = values[1] if len(values) > 1 else "video"  # Title is now at index 1
             
             # Phase 2: Show loading status and fetch formats
-            self.status_label.config(text=f"Fetching available qualities for '{title}'...", foreground="#3498db")
+            self._set_status(f"Fetching available qualities for '{title}'...", "#3498db")
             
             # Run metadata fetch in background thread
-            threading.Thread(
-                target=self._fetch_formats_and_add,
-                args=(url, title),
-                daemon=True
-            ).start()
+            self._submit_bg(self._fetch_formats_and_add, url, title)
         except tk.TclError as e:
             # Widget was destroyed or invalid - ignore
             self.logger.debug(f"TclError in add_selected_to_queue: {e}")
@@ -1222,14 +1336,10 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 return
             
             # Use downloader from app with timeout
-            import concurrent.futures
-            from threading import Thread
-            
             downloader = self.app.download_manager.video_downloader
             
             # Create a future for the extraction with timeout
-            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-            future = executor.submit(downloader.extract_info, url)
+            future = self._format_executor.submit(downloader.extract_info, url)
             
             try:
                 # Wait max 15 seconds for extraction
@@ -1242,22 +1352,20 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 
                 if result['type'] == 'playlist':
                     # Show playlist confirmation on main thread
-                    self.safe_after(0, lambda r=result: self._show_playlist_confirm(r))
+                    self.safe_after(0, self._show_playlist_confirm, result)
                 else:
                     # Show quality dialog for single video on main thread
-                    self.safe_after(0, lambda v=result['video_info']: self._show_quality_dialog(v))
+                    self.safe_after(0, self._show_quality_dialog, result['video_info'])
                     
             except concurrent.futures.TimeoutError:
                 # Timeout - show default quality options
                 self.logger.warning(f"Timeout fetching formats for {url}, using defaults")
                 if not self.is_destroyed():
-                    self.safe_after(0, lambda: self._show_default_quality_dialog(url, title))
-            finally:
-                executor.shutdown(wait=False)
+                    self.safe_after(0, self._show_default_quality_dialog, url, title)
             
         except Exception as e:
             if not self.is_destroyed():
-                self.safe_after(0, lambda msg=str(e): self._on_metadata_error(msg))
+                self.safe_after(0, self._on_metadata_error, str(e))
 
     def _show_playlist_confirm(self, playlist_info):
         """Confirm adding a playlist to the queue."""
@@ -1274,51 +1382,48 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             if dialog.result:
                 self._add_playlist_to_queue(playlist_info, dialog.result)
             else:
-                self.status_label.config(text="Enter a search query to find videos", foreground="#888888")
+                self._reset_status_label()
         else:
-            self.status_label.config(text="Enter a search query to find videos", foreground="#888888")
+            self._reset_status_label()
 
     def _add_playlist_to_queue(self, playlist_info, selected_quality):
         """Add all entries from a playlist to the queue."""
         entries = playlist_info['entries']
-        added_count = 0
         
+        # Get download settings once for the whole playlist
+        download_path = self.app.settings_manager.get_download_directory()
+        subtitle_download = self.app.settings_manager.get("subtitle_download", False)
+        
+        video_infos = []
         for entry in entries:
             url = entry.get('url') or entry.get('webpage_url')
             if not url: continue
             
-            video_info = VideoInfo(
+            video_infos.append(VideoInfo(
                 url=url,
                 title=entry.get('title', 'Unknown'),
-                selected_quality=selected_quality
+                selected_quality=selected_quality,
+                download_subtitles=subtitle_download
+            ))
+        
+        # Add all entries in one operation; duplicates are skipped
+        try:
+            added_count, _ = self.app.queue_manager.add_tasks(
+                video_infos,
+                download_path=download_path
             )
-            
-            try:
-                # Get download settings
-                download_path = self.app.settings_manager.get_download_directory()
-                video_info.download_subtitles = self.app.settings_manager.get("subtitle_download", False)
-                
-                self.app.queue_manager.add_task(
-                    video_info=video_info,
-                    download_path=download_path
-                )
-                added_count += 1
-            except Exception:
-                # Skip duplicates or errors
-                continue
+        except Exception as e:
+            self.logger.warning(f"Failed to add playlist to queue: {e}")
+            added_count = 0
         
         if added_count > 0:
-            # Save pending downloads
-            if hasattr(self.app, 'save_pending_downloads'):
-                self.app.save_pending_downloads()
-            
-            if hasattr(self.app, 'queue_screen'):
-                self.app.queue_screen.refresh_queue()
-            self.status_label.config(text=f"Added {added_count} videos from playlist to queue!", foreground="#10b981")
+            # Save pending downloads and refresh queue screen
+            self._on_queue_changed()
+            self._set_status(f"Added {added_count} videos from playlist to queue!", "#10b981")
         else:
-            self.status_label.config(text="No videos added from playlist", foreground="#ef4444")
+            self._set_status("No videos added from playlist", "#ef4444")
             
-        self.safe_after(5000, lambda: self.status_label.config(text="Enter a search query to find videos", foreground="#888888"))
+        self.safe_after(5000, self._reset_status_label)
 
     def _show_quality_dialog(self, video_info):
         """Show the quality selection dialog."""
@@ -1330,7 +1435,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 self._finalize_add_to_queue(video_info)
             else:
                 # User cancelled
-                self.status_label.config(text="Enter a search query to find videos", foreground="#888888")
+                self._reset_status_label()
         except tk.TclError as e:
             self.logger.debug(f"TclError in _show_quality_dialog: {e}")
         except Exception as e:
@@ -1353,7 +1458,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 self._finalize_add_to_queue(video_info)
             else:
                 # User cancelled
-                self.status_label.config(text="Enter a search query to find videos", foreground="#888888")
+                self._reset_status_label()
         except tk.TclError as e:
             self.logger.debug(f"TclError in _show_default_quality_dialog: {e}")
         except Exception as e:
@@ -1374,13 +1479,8 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
                 download_path=download_path
             )
             
-            # Save pending downloads
-            if hasattr(self.app, 'save_pending_downloads'):
-                self.app.save_pending_downloads()
-            
-            # Refresh queue screen to show new task
-            if hasattr(self.app, 'queue_screen'):
-                self.app.queue_screen.refresh_queue()
+            # Save pending downloads and refresh queue screen to show new task
+            self._on_queue_changed()
             
             # We already have metadata, so no need to fetch again, 
             # but we might want to trigger any other background tasks if needed.
@@ -1388,28 +1488,41 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             # Let's just update the status ourselves or call it.
             
             # Non-blocking success notification
-            self.status_label.config(text=f"Added '{video_info.title}' ({video_info.selected_quality}) to queue!", foreground="#10b981")
-            self.safe_after(3000, lambda: self.status_label.config(text="Enter a search query to find videos", foreground="#888888"))
+            self._set_status(f"Added '{video_info.title}' ({video_info.selected_quality}) to queue!", "#10b981")
+            self.safe_after(3000, self._reset_status_label)
             
         except ValueError as e:
             messagebox.showerror("Error", str(e))
-            self.status_label.config(text="Error: Video already in queue", foreground="#ef4444")
+            self._set_status("Error: Video already in queue", "#ef4444")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add video to queue: {str(e)}")
-            self.status_label.config(text="Error adding to queue", foreground="#ef4444")
+            self._set_status("Error adding to queue", "#ef4444")
 
+    def _on_queue_changed(self):
+        """Persist pending downloads and refresh the queue screen after adding tasks."""
+        if self._save_pending:
+            self._save_pending()
+        
+        if self._refresh_queue is None:
+            queue_screen = getattr(self.app, 'queue_screen', None)
+            self._refresh_queue = getattr(queue_screen, 'refresh_queue', None)
+        if self._refresh_queue:
+            self._refresh_queue()
+    
     def _on_metadata_error(self, error_msg):
         """Handle error during pre-download metadata fetch."""
-        self.status_label.config(text=f"Error fetching qualities: {error_msg}", foreground="#ef4444")
+        self._set_status(f"Error fetching qualities: {error_msg}", "#ef4444")
         messagebox.showerror("Metadata Error", f"Could not retrieve video formats: {error_msg}")
     
     def clear_results(self):
         """Clear all search results."""
         try:
-            for item in self.results_tree.get_children():
-                self.results_tree.delete(item)
+            # Delete all rows in a single Tcl call
+            self.results_tree.delete(*self.results_tree.get_children())
             self.search_results = []
             self.expanded_items = {}
+            self._item_id_to_index = {}
+            self._rendered_count = 0
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in clear_results: {e}")
@@ -1439,31 +1552,22 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             return  # User cancelled or didn't select any platforms
         
         # Start batch comparison in background
-        self.status_label.config(
-            text=f"Comparing '{query}' across {len(selected_platforms)} platforms...",
-            foreground="#10b981"
-        )
+        self._set_status(f"Comparing '{query}' across {len(selected_platforms)} platforms...", "#10b981")
         
         # Show progress bar
         self.show_progress(f"Comparing across {len(selected_platforms)} platforms...")
         
         self.compare_btn.config(state="disabled")
         
-        threading.Thread(
-            target=self._perform_batch_comparison,
-            args=(query, selected_platforms),
-            daemon=True
-        ).start()
+        self._submit_bg(self._perform_batch_comparison, query, selected_platforms)
     
     def _perform_batch_comparison(self, query, platforms):
         """Perform batch comparison in background thread."""
         try:
             # Get filter values
             region = self.region_var.get()
-            timelimit_map = {"Any": None, "Day": "d", "Week": "w", "Month": "m", "Year": "y"}
-            timelimit = timelimit_map.get(self.time_var.get())
-            duration_map = {"Any": None, "Short": "short", "Medium": "medium", "Long": "long"}
-            duration = duration_map.get(self.duration_var.get())
+            timelimit = TIMELIMIT_MAP.get(self.time_var.get())
+            duration = DURATION_MAP.get(self.duration_var.get())
             
             # Execute comparison search
             platform_results = self.search_manager.compare_platforms(
@@ -1478,14 +1582,22 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             # Enrich results if enabled
             if self.enrichment_enabled:
                 self.logger.info("Enriching comparison results...")
-                enriched_platform_results = {}
                 
-                for platform_name, results in platform_results.items():
-                    if results:
-                        enriched_results = self.search_manager.enrich_results_batch(results, max_workers=3)
-                        enriched_platform_results[platform_name] = enriched_results
-                    else:
-                        enriched_platform_results[platform_name] = []
+                # Enrich all platforms concurrently so their tasks share the
+                # search pool instead of waiting for each platform in turn.
+                # A local executor is used because enrich_results_batch blocks
+                # on search_pool and must not run on a search_pool worker.
+                non_empty = {name: results for name, results in platform_results.items() if results}
+                enriched_platform_results = {name: [] for name in platform_results}
+                
+                if non_empty:
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=len(non_empty)) as outer:
+                        futures = {
+                            name: outer.submit(self.search_manager.enrich_results_batch, results, 3)
+                            for name, results in non_empty.items()
+                        }
+                        for name, future in futures.items():
+                            enriched_platform_results[name] = future.result()
                 
                 platform_results = enriched_platform_results
             
@@ -1493,11 +1605,11 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             ranked_results = self.search_manager.rank_comparison_results(platform_results)
             
             # Show comparison dialog on main thread
-            self.safe_after(0, lambda r=ranked_results: self._show_comparison_dialog(query, r))
+            self._ui_queue.put_nowait((self._show_comparison_dialog, (query, ranked_results)))
             
         except Exception as e:
             self.logger.error(f"Batch comparison failed: {e}")
-            self.safe_after(0, lambda err=str(e): self._on_comparison_error(err))
+            self._ui_queue.put_nowait((self._on_comparison_error, (str(e),)))
     
     def _show_comparison_dialog(self, query, ranked_results):
         """Show the batch comparison dialog."""
@@ -1505,10 +1617,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         self.hide_progress()
         
         self.compare_btn.config(state="normal")
-        self.status_label.config(
-            text="Comparison complete",
-            foreground="#10b981"
-        )
+        self._set_status("Comparison complete", "#10b981")
         
         # Show dialog
         dialog = BatchCompareDialog(
@@ -1519,10 +1628,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         )
         
         # Auto-hide status after dialog closes
-        self.safe_after(3000, lambda: self.status_label.config(
-            text="Enter a search query to find videos",
-            foreground="#888888"
-        ))
+        self.safe_after(3000, self._reset_status_label)
     
     def _on_comparison_error(self, error_msg):
         """Handle comparison error."""
@@ -1530,10 +1636,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         self.hide_progress()
         
         self.compare_btn.config(state="normal")
-        self.status_label.config(
-            text=f"Comparison failed: {error_msg}",
-            foreground="#ef4444"
-        )
+        self._set_status(f"Comparison failed: {error_msg}", "#ef4444")
         messagebox.showerror(
             "Comparison Error",
             f"Failed to compare platforms: {error_msg}",
@@ -1549,100 +1652,124 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             raise ValueError("Invalid video URL")
         
         # Show loading status
-        self.status_label.config(
-            text=f"Fetching available qualities for '{title}'...",
-            foreground="#3498db"
-        )
+        self._set_status(f"Fetching available qualities for '{title}'...", "#3498db")
         
         # Run metadata fetch in background thread
-        threading.Thread(
-            target=self._fetch_formats_and_add,
-            args=(url, title),
-            daemon=True
-        ).start()
-    
-    def refresh_platform_health(self):
-        """Refresh platform health status for all platforms."""
-        self.status_label.config(
-            text="Checking platform health status...",
-            foreground="#10b981"
-        )
+        self._submit_bg(self._fetch_formats_and_add, url, title)
+    
+    def refresh_platform_health(self, force=False):
+        """
+        Refresh platform health status for all platforms.
         
-        # Show progress bar
-        self.show_progress("Checking health of all platforms...")
+        Results younger than HEALTH_CACHE_TTL are reused without probing the
+        platforms again.
         
-        self.health_refresh_btn.config(state="disabled", text="⏳")
+        Args:
+            force: If True, ignore cached results and run a fresh check.
+        """
+        # Collapse repeated requests into the check that is already running
+        with self._health_check_lock:
+            if self._health_check_inflight:
+                self.logger.debug("Platform health check already in progress")
+                return
+            
+            if (not force and self._health_cache
+                    and time.monotonic() - self._health_cache_ts < HEALTH_CACHE_TTL):
+                cached_results = self._health_cache
+            else:
+                cached_results = None
+                self._health_check_inflight = True
         
-        # Run health check in background thread
-        threading.Thread(
-            target=self._check_platform_health_thread,
-            daemon=True
-        ).start()
+        if cached_results is not None:
+            self.logger.debug("Using cached platform health results")
+            self._on_health_check_complete(cached_results)
+            return
+        
+        try:
+            self._set_status("Checking platform health status...", "#10b981")
+            
+            # Show progress bar
+            self.show_progress("Checking health of all platforms...")
+            
+            self.health_refresh_btn.config(state="disabled", text="⏳")
+            
+            # Run health check in background thread
+            if self._submit_bg(self._check_platform_health_thread) is None:
+                with self._health_check_lock:
+                    self._health_check_inflight = False
+        except Exception:
+            # Don't leave the in-flight flag set if the check never started
+            with self._health_check_lock:
+                self._health_check_inflight = False
+            raise
     
     def _check_platform_health_thread(self):
         """Check platform health in background thread."""
         try:
             # Check if widget is still alive before starting
-            if self.is_destroyed():
+            if not self._alive.is_set():
                 self.logger.debug("Widget destroyed, skipping health check")
                 return
             
             # Check health of all platforms
             health_results = self.search_manager.check_all_platforms_health()
+            self._health_cache = health_results
+            self._health_cache_ts = time.monotonic()
             
             # Check again before scheduling callback
-            if self.is_destroyed():
+            if not self._alive.is_set():
                 self.logger.debug("Widget destroyed during health check, skipping callback")
                 return
             
             # Update UI on main thread
-            self.safe_after(0, lambda r=health_results: self._on_health_check_complete(r))
+            self._ui_queue.put_nowait((self._on_health_check_complete, (health_results,)))
             
         except Exception as e:
             self.logger.error(f"Platform health check failed: {e}")
             # Check if widget is still alive before scheduling error callback
-            if not self.is_destroyed():
-                self.safe_after(0, lambda err=str(e): self._on_health_check_error(err))
+            if self._alive.is_set():
+                self._ui_queue.put_nowait((self._on_health_check_error, (str(e),)))
     
     def _on_health_check_complete(self, health_results):
         """Handle health check completion on main thread."""
+        with self._health_check_lock:
+            self._health_check_inflight = False
+        
         # Hide progress bar
         self.hide_progress()
         
         self.platform_health_status = health_results
         
-        # Update domain filter dropdown with health indicators
-        self._update_domain_filter_with_health()
+        # Rebuild the domain filter dropdown once idle so the summary paints first
+        self.safe_after_idle(self._update_domain_filter_with_health)
         
         # Re-enable refresh button
         self.health_refresh_btn.config(state="normal", text="🔄")
         
         # Count health statuses
-        healthy_count = sum(1 for status in health_results.values() if status == "healthy")
-        broken_count = sum(1 for status in health_results.values() if status == "broken")
-        unknown_count = sum(1 for status in health_results.values() if status == "unknown")
+        counts = Counter(health_results.values())
+        healthy_count = counts.get("healthy", 0)
+        broken_count = counts.get("broken", 0)
+        unknown_count = counts.get("unknown", 0)
         
-        self.status_label.config(
-            text=f"Platform health: {healthy_count} healthy, {broken_count} broken, {unknown_count} unknown",
-            foreground="#10b981"
-        )
+        # Skip the redraw when a repeat check produced the summary already on screen
+        summary = f"Platform health: {healthy_count} healthy, {broken_count} broken, {unknown_count} unknown"
+        if self._status_text != summary:
+            self._set_status(summary, "#10b981")
         
         # Auto-hide status after 5 seconds
-        self.safe_after(5000, lambda: self.status_label.config(
-            text="Enter a search query to find videos",
-            foreground="#888888"
-        ))
+        self.safe_after(5000, self._reset_status_label)
     
     def _on_health_check_error(self, error_msg):
         """Handle health check error on main thread."""
+        with self._health_check_lock:
+            self._health_check_inflight = False
+        
         # Hide progress bar
         self.hide_progress()
         
         self.health_refresh_btn.config(state="normal", text="🔄")
-        self.status_label.config(
-            text=f"Health check failed: {error_msg}",
-            foreground="#ef4444"
-        )
+        self._set_status(f"Health check failed: {error_msg}", "#ef4444")
         
         messagebox.showerror(
             "Health Check Error",
@@ -1652,65 +1779,33 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
     
     def _update_domain_filter_with_health(self):
         """Update domain filter dropdown to show health indicators."""
-        # Get current platforms in dropdown
-        base_platforms = ["All", "YouTube", "Vimeo", "Dailymotion", "OK.ru"]
-        
-        # Add health indicators to platform names
-        updated_values = []
-        for platform in base_platforms:
-            if platform == "All":
-                updated_values.append(platform)
-            else:
-                status = self.platform_health_status.get(platform, "unknown")
-                icon = PlatformHealthIndicator.STATUS_ICONS.get(status, "❓")
-                updated_values.append(f"{icon} {platform}")
+        icons = PlatformHealthIndicator.STATUS_ICONS
+        health_status = self.platform_health_status
         
-        # Update combobox values
-        self.domain_combo.config(values=updated_values)
+        # Add health indicators to platform names ("All" is always first and has none)
+        updated_values = ("All",) + tuple(
+            f"{icons.get(health_status.get(platform, 'unknown'), '❓')} {platform}"
+            for platform in _BASE_PLATFORMS[1:]
+        )
         
-        # Update current selection to include health indicator
+        # Work out the decorated selection before touching the widget so the
+        # values and the variable are applied back to back, and the variable
+        # (whose write fires the combobox trace) only when it actually changes
         current_value = self.domain_var.get()
-        if current_value != "All" and current_value in base_platforms:
-            status = self.platform_health_status.get(current_value, "unknown")
-            icon = PlatformHealthIndicator.STATUS_ICONS.get(status, "❓")
-            self.domain_var.set(f"{icon} {current_value}")
+        platform = current_value.translate(HEALTH_ICON_STRIP_TABLE).strip()
+        new_value = current_value
+        if platform != "All" and platform in _BASE_PLATFORMS:
+            new_value = updated_values[_BASE_PLATFORMS.index(platform)]
+        
+        if updated_values != self._domain_values:
+            self.domain_combo.config(values=updated_values)
+            self._domain_values = updated_values
+        if new_value != current_value:
+            self.domain_var.set(new_value)
     
     def _get_clean_domain_value(self):
         """Get domain value without health indicator icon and map to actual domain."""
-        domain_value = self.domain_var.get()
-        
-        # Remove health indicator icons if present
-        for icon in PlatformHealthIndicator.STATUS_ICONS.values():
-            domain_value = domain_value.replace(icon, "").strip()
-        
-        # Skip category separators
-        if domain_value.startswith("---") or domain_value == "All":
-            return None
-        
-        # Map platform names to domains
-        domain_map = {
-            "YouTube": "youtube.com",
-            "Vimeo": "vimeo.com",
-            "Dailymotion": "dailymotion.com",
-            "OK.ru": "ok.ru",
-            "Rumble": "rumble.com",
-            "Bilibili": "bilibili.com",
-            "Niconico": "nicovideo.jp",
-            "Crunchyroll": "crunchyroll.com",
-            "SoundCloud": "soundcloud.com",
-            "Bandcamp": "bandcamp.com",
-            "Audiomack": "audiomack.com",
-            "Mixcloud": "mixcloud.com",
-            "TikTok": "tiktok.com",
-            "Instagram": "instagram.com",
-            "Twitter": "twitter.com",
-            "Reddit": "reddit.com",
-            "Twitch": "twitch.tv",
-            "Spotify": "spotify.com"
-        }
-        
-        mapped_domain = domain_map.get(domain_value)
-        return mapped_domain if mapped_domain else None
+        return _clean_domain(self.domain_var.get())
     
     def show_progress(self, message="Processing..."):
         """
@@ -1720,9 +1815,13 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             message: Message to display with the progress bar.
         """
         try:
-            self.progress_label.config(text=message)
+            self._tk_call(self._progress_path, "configure", "-text", message)
             self.progress_frame.pack(fill=X, pady=(0, 10), before=self.status_label)
-            self.progress_bar.start(10)  # Start animation with 10ms interval
+            
+            # Only animate if the operation outlasts the delay; short operations
+            # just show the static label and skip the spinner redraws entirely
+            self._cancel_progress_start()
+            self._progress_start_id = self.safe_after(500, self._start_progress)
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in show_progress: {e}")
@@ -1733,6 +1832,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
     def hide_progress(self):
         """Hide the progress bar."""
         try:
+            self._cancel_progress_start()
             self.progress_bar.stop()
             self.progress_frame.pack_forget()
         except tk.TclError as e:
@@ -1742,6 +1842,27 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             # Log other errors but don't crash
             self.logger.error(f"Error in hide_progress: {e}", exc_info=True)
     
+    def _start_progress(self):
+        """Start the progress animation once the show_progress delay has passed."""
+        self._untrack_callback(self._progress_start_id)
+        self._progress_start_id = None
+        self.progress_bar.start(50)
+    
+    def _cancel_progress_start(self):
+        """Cancel a delayed progress animation start that has not run yet."""
+        after_id = self._progress_start_id
+        if after_id:
+            self._progress_start_id = None
+            self._untrack_callback(after_id)
+            self.after_cancel(after_id)
+    
+    def _untrack_callback(self, callback_id):
+        """Drop a callback that has run or been cancelled from the mixin's cleanup list."""
+        try:
+            self._callback_ids.remove(callback_id)
+        except ValueError:
+            pass
+    
     def update_progress_message(self, message):
         """
         Update the progress bar message without stopping it.
@@ -1750,7 +1871,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             message: New message to display.
         """
         try:
-            self.progress_label.config(text=message)
+            self._tk_call(self._progress_path, "configure", "-text", message)
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in update_progress_message: {e}")
@@ -1758,6 +1879,16 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             # Log other errors but don't crash
             self.logger.error(f"Error in update_progress_message: {e}", exc_info=True)
     
+    def _set_status(self, text, foreground):
+        """Set the status label text and color with a single direct Tcl call."""
+        # Bypasses ttk's Python-side option handling, which runs on every config()
+        self._tk_call(self._status_path, "configure", "-text", text, "-foreground", foreground)
+        self._status_text = text
+    
+    def _reset_status_label(self):
+        """Restore the idle status message."""
+        self._set_status("Enter a search query to find videos", "#888888")
+    
     def _safe_update_status(self, text, foreground="#888888"):
         """
         Safely update status label text and color.
@@ -1767,7 +1898,7 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             foreground: Text color
         """
         try:
-            self.status_label.config(text=text, foreground=foreground)
+            self._set_status(text, foreground)
         except tk.TclError as e:
             # Widget was destroyed - ignore
             self.logger.debug(f"TclError in _safe_update_status: {e}")
@@ -1775,6 +1906,53 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
             # Log other errors but don't crash
             self.logger.error(f"Error in _safe_update_status: {e}", exc_info=True)
     
+    def _drain_ui_queue(self):
+        """Run callbacks posted by worker threads, then re-arm the 50ms pump."""
+        self._ui_pump_id = None
+        if self.is_destroyed():
+            return
+        
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except tk.TclError as e:
+                self.logger.debug(f"TclError in queued callback: {e}")
+            except Exception as e:
+                self.logger.error(f"Error in queued callback: {e}", exc_info=True)
+        
+        # Plain after() so the recurring timer is not added to the tracked callback list
+        self._ui_pump_id = self.after(50, self._drain_ui_queue)
+    
+    def _stop_ui_pump(self):
+        """Cancel the pending UI queue pump, if any."""
+        if self._ui_pump_id is not None:
+            try:
+                self.after_cancel(self._ui_pump_id)
+            except tk.TclError:
+                pass
+            self._ui_pump_id = None
+    
+    def _submit_bg(self, fn, *args):
+        """
+        Run fn on the background pool unless the screen has been cleaned up.
+        
+        Returns:
+            The task's Future, or None if the pool no longer accepts work.
+        """
+        if not self._alive.is_set():
+            self.logger.debug(f"Screen cleaned up, not starting {fn.__name__}")
+            return None
+        try:
+            return self._bg_pool.submit(fn, *args)
+        except RuntimeError:
+            # cleanup() shut the pool down after the check above
+            self.logger.debug(f"Background pool shut down, not starting {fn.__name__}")
+            return None
+    
     def cleanup(self):
         """
         Cleanup method to unsubscribe from events and cancel callbacks.
@@ -1784,21 +1962,34 @@ class SearchScreen(SafeCallbackMixin, ttk.Frame):
         ensure proper resource cleanup.
         """
         self.logger.info("Cleaning up SearchScreen")
+        self._alive.clear()
         
         # Unsubscribe from all events
-        if self.event_bus:
-            for sub_id in self._subscription_ids:
-                try:
-                    self.event_bus.unsubscribe(sub_id)
-                    self.logger.debug(f"Unsubscribed from event with ID {sub_id}")
-                except Exception as e:
-                    self.logger.error(f"Error unsubscribing from event {sub_id}: {e}")
+        if self.event_bus and self._subscription_ids:
+            try:
+                removed = self.event_bus.unsubscribe_many(self._subscription_ids)
+                self.logger.debug(f"Unsubscribed from {removed} event(s)")
+            except Exception as e:
+                self.logger.error(f"Error unsubscribing from events: {e}")
             self._subscription_ids.clear()
         
-        # Cleanup callbacks from SafeCallbackMixin
+        # Let running background tasks finish; they check is_destroyed() before touching the UI
+        self._bg_pool.shutdown(wait=False)
+        
+        # Stop the worker-result pump and cleanup callbacks from SafeCallbackMixin
+        self._stop_ui_pump()
         self.cleanup_callbacks()
         
         self.logger.info("SearchScreen cleanup complete")
+    
+    def destroy(self):
+        """Shut down the worker pools and UI pump before destroying the screen."""
+        # Pending work finishes in the background; callers check is_destroyed()
+        self._alive.clear()
+        self._format_executor.shutdown(wait=False)
+        self._bg_pool.shutdown(wait=False)
+        self._stop_ui_pump()
+        super().destroy()
 
 
 class PlatformSelectionDialog(ttk.Toplevel):
@@ -1865,31 +2056,42 @@ class PlatformSelectionDialog(ttk.Toplevel):
         # Platform categories and checkboxes
         from controllers.search_manager import PLATFORM_CATEGORIES
         
-        for category_name, category_info in PLATFORM_CATEGORIES.items():
+        # Filter out experimental platforms (marked with an asterisk) up front
+        categories = [
+            (category_name, category_info['icon'],
+             [p for p in category_info['platforms'] if '*' not in p])
+            for category_name, category_info in PLATFORM_CATEGORIES.items()
+        ]
+        
+        # Create every widget first, then pack them in a second pass so Tk
+        # computes the layout once instead of after each new checkbox
+        widgets = []
+        for category_name, icon, platforms in categories:
             # Category header
             category_frame = ttk.Labelframe(
                 scrollable_frame,
-                text=f"{category_info['icon']} {category_name}",
+                text=f"{icon} {category_name}",
                 padding=10,
                 bootstyle="primary"
             )
-            category_frame.pack(fill=X, pady=(0, 10))
             
             # Platform checkboxes
-            for platform in category_info['platforms']:
-                # Skip platforms with asterisk (experimental)
-                if '*' in platform:
-                    continue
-                
-                var = ttk.BooleanVar(value=False)
+            checkboxes = []
+            for platform in platforms:
+                var = tk.IntVar(self, value=0)
                 self.platform_vars[platform] = var
                 
-                checkbox = ttk.Checkbutton(
+                checkboxes.append(ttk.Checkbutton(
                     category_frame,
                     text=platform,
                     variable=var,
                     bootstyle="primary-round-toggle"
-                )
+                ))
+            widgets.append((category_frame, checkboxes))
+        
+        for category_frame, checkboxes in widgets:
+            category_frame.pack(fill=X, pady=(0, 10))
+            for checkbox in checkboxes:
                 checkbox.pack(anchor=W, pady=2)
         
         # Button frame
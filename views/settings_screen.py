@@ -4,9 +4,10 @@ Provides configuration options for the application.
 """
 
 import ttkbootstrap as ttk
-from ttkbootstrap.constants import *
-from tkinter import filedialog, messagebox
-from pathlib import Path
+from ttkbootstrap.constants import BOTH, EW, LEFT, NW, RIGHT, VERTICAL, W, X, Y, YES
+from tkinter import messagebox
+from tkinter import font as tkfont
+from utils import set_debug_mode
 from utils.safe_callback_mixin import SafeCallbackMixin
 from utils.event_bus import EventBus, Event, EventType
 from utils.logger import get_logger
@@ -15,6 +16,72 @@ from utils.logger import get_logger
 class SettingsScreen(SafeCallbackMixin, ttk.Frame):
     """Settings screen with all configuration options."""
     
+    # Fixed width of every section for consistency
+    SECTION_WIDTH = 900
+    
+    # Sections farther than this many pixels outside the viewport are hidden
+    SECTION_MARGIN = 200
+    SAVE_DELAY_MS = 250  # Trailing debounce for option toggles
+    LAYOUT_DELAY_MS = 50  # Trailing throttle for section re-layout
+    
+    # Combobox choices
+    PROXY_TYPES = ("http", "https", "socks5")
+    AUDIO_FORMATS = ("mp3", "m4a", "wav", "flac")
+    
+    # Bootstyle shared by most toggles
+    _TOGGLE = "success-round-toggle"
+    
+    # Settings edited through a Tk variable: (settings key, variable class, default).
+    # The variables live in self._vars and exist before their sections are built.
+    _VAR_SPEC = (
+        ("download_directory", ttk.StringVar, ""),
+        ("proxy_enabled", ttk.BooleanVar, False),
+        ("proxy_host", ttk.StringVar, ""),
+        ("proxy_port", ttk.StringVar, ""),
+        ("proxy_type", ttk.StringVar, "http"),
+        ("subtitle_download", ttk.BooleanVar, False),
+        ("notifications_enabled", ttk.BooleanVar, True),
+        ("auto_resume", ttk.BooleanVar, True),
+        ("debug_mode", ttk.BooleanVar, False),
+        ("extract_audio", ttk.BooleanVar, False),
+        ("audio_format", ttk.StringVar, "mp3"),
+        ("embed_thumbnail", ttk.BooleanVar, False),
+        ("embed_metadata", ttk.BooleanVar, False),
+        ("sponsorblock_enabled", ttk.BooleanVar, False),
+        ("cookies_path", ttk.StringVar, ""),
+        ("os_username", ttk.StringVar, ""),
+        ("os_password", ttk.StringVar, ""),
+        ("os_api_key", ttk.StringVar, ""),
+    )
+    _PROXY_KEYS = ("proxy_enabled", "proxy_host", "proxy_port", "proxy_type")
+    _OPTION_KEYS = (
+        "subtitle_download", "notifications_enabled", "auto_resume", "debug_mode",
+        "extract_audio", "audio_format", "embed_thumbnail", "embed_metadata",
+        "sponsorblock_enabled", "cookies_path", "os_username", "os_password", "os_api_key",
+    )
+    
+    # Sections made only of toggles: title -> (pady, rows), where each row is
+    # (settings key, label, bootstyle)
+    _CHECKBOX_SECTIONS = {
+        "Advanced Options": (5, (
+            ("subtitle_download", "Download subtitles automatically", _TOGGLE),
+            ("notifications_enabled", "Show desktop notifications", _TOGGLE),
+            ("auto_resume", "Auto-resume unfinished downloads", _TOGGLE),
+            ("debug_mode", "Debug Mode (Verbose Logging)", "warning-round-toggle"),
+        )),
+        "Post-Processing": (2, (
+            ("embed_thumbnail", "Embed Thumbnail", _TOGGLE),
+            ("embed_metadata", "Embed Metadata", _TOGGLE),
+            ("sponsorblock_enabled", "Enable SponsorBlock (Skip Sponsors)", "info-round-toggle"),
+        )),
+    }
+    
+    # Fonts shared by every instance; created on first construction since
+    # they need a Tk root. Labels otherwise use the named styles configured
+    # by ThemeManager.
+    _FONT_MONO = None
+    _FONT_CAPTION = None
+    
     def __init__(self, parent, app, event_bus: EventBus = None):
         """
         Initialize SettingsScreen.
@@ -28,12 +95,67 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
         SafeCallbackMixin.__init__(self)
         self.app = app
         self.event_bus = event_bus
+        # main.py builds the download manager before any screen
+        self._dl_mgr = getattr(app, 'download_manager', None)
         self.loading = True
         self.logger = get_logger()
         self._subscription_ids = []  # Track event subscriptions for cleanup
+        self._vars = {  # Settings key -> Tk variable bound to that key's widget
+            key: var_class(value=default) for key, var_class, default in self._VAR_SPEC
+        }
+        self._dirty = {}  # Option values changed since the last flush
+        self._save_after_id = None  # Pending _flush_dirty callback
+        
+        # Subscribe to events if event_bus is provided
+        if self.event_bus:
+            self._subscribe_to_events()
+        
+        self._init_fonts()
         self.setup_ui()
-        self.load_settings()
-        self.loading = False
+        
+        # Populate after the first paint; self.loading stays set until then so
+        # the variable defaults don't fire the save callbacks
+        self.safe_after_idle(self._finish_loading)
+    
+    def _subscribe_to_events(self):
+        """Subscribe to EventBus events."""
+        sub_id = self.event_bus.subscribe(
+            EventType.SETTINGS_CHANGED,
+            self._on_external_settings_change
+        )
+        self._subscription_ids.append(sub_id)
+    
+    def _on_external_settings_change(self, event: Event):
+        """
+        Handle settings changed event.
+        
+        Args:
+            event: Event containing changed_keys and settings
+        """
+        values = (event.data or {}).get("settings", {})
+        
+        # Update only the variables of the keys that changed; edits still
+        # waiting for the save timer win over the published values
+        was_loading = self.loading
+        self.loading = True
+        try:
+            for key, value in values.items():
+                if key in self._vars and key not in self._dirty:
+                    self._set_var(key, value)
+                elif key == "theme" and hasattr(self, "theme_var"):
+                    self.theme_var.set(value == "dark")
+                elif key == "download_mode" and hasattr(self, "mode_var"):
+                    self.mode_var.set(value)
+        finally:
+            self.loading = was_loading
+    
+    @classmethod
+    def _init_fonts(cls):
+        """Create the shared fonts once so widgets reuse the same Tk font objects."""
+        if cls._FONT_MONO is not None:
+            return
+        cls._FONT_MONO = tkfont.Font(family="Consolas", size=10)
+        cls._FONT_CAPTION = tkfont.Font(family="Segoe UI", size=8)
     
     def setup_ui(self):
         """Set up the settings screen UI."""
@@ -45,43 +167,198 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
         title_label = ttk.Label(
             container,
             text="Settings",
-            font=("Segoe UI", 20, "bold")
+            style="Title.TLabel"
         )
         title_label.pack(anchor=W, pady=(0, 20))
         
-        # Scrollable area
+        # Scrollable area. Each section is its own canvas window item so the
+        # ones scrolled well out of view can be hidden and skipped by Tk.
         canvas = ttk.Canvas(container, highlightthickness=0)
         scrollbar = ttk.Scrollbar(container, orient=VERTICAL, command=canvas.yview, bootstyle="round")
-        scrollable_frame = ttk.Frame(canvas)
+        self._canvas = canvas
+        self._scrollbar = scrollbar
+        self._section_items = []  # (item_id, frame, pad_top, pad_bottom) in display order
+        self._section_spans = []  # (item_id, y0, y1) from the last layout pass
+        self._hidden_sections = set()  # Item IDs currently hidden
+        self._layout_pending = None  # Callback ID of a scheduled _layout_sections
+        
+        canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        
+        # Scroll with the mouse wheel over the canvas or any widget in a
+        # section. A bind tag of our own keeps the binding off the shared
+        # "all" tag that other scrollable screens use.
+        self._wheel_tag = f"SettingsWheel{id(self)}"
+        # X11 reports the wheel as buttons 4 and 5 instead of <MouseWheel>
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind_class(self._wheel_tag, sequence, self._on_mousewheel)
+        self._add_wheel_tag(canvas)
+        
+        # Sections as (builder, loader) pairs in display order; sections bound
+        # only to self._vars need no loader of their own. Only the ones
+        # visible on open are built now; the rest are built one per idle tick
+        # so the screen paints before all of its widgets exist.
+        sections = [
+            (self._build_directory_section, None),
+            (self._build_appearance_section, self._load_appearance_section),
+            (self._build_mode_section, self._load_mode_section),
+            (self._build_proxy_section, None),
+            (self._build_options_section, None),
+            (self._build_audio_section, None),
+            (self._build_post_section, None),
+            (self._build_auth_section, None),
+            (self._build_os_auth_section, None),
+            (self._build_buttons, None),
+        ]
+        self._section_loaders = []  # Loaders of sections that have been built
+        for build, load in sections[:2]:
+            self._realize_section(build, load)
+        self._pending_sections = sections[2:]
+        
+        # Pack layouts
+        canvas.pack(side=LEFT, fill=BOTH, expand=YES)
+        scrollbar.pack(side=RIGHT, fill=Y)
+        
+        self.safe_after_idle(self._build_next_section)
+    
+    def _realize_section(self, build, load):
+        """
+        Build a section and populate it from the current settings.
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        Args:
+            build: Method creating the section's widgets on the canvas.
+            load: Method filling widgets not bound to self._vars from a
+                settings snapshot, or None.
+        """
+        first_new = len(self._section_items)
+        build(self._canvas)
+        for _, frame, _, _ in self._section_items[first_new:]:
+            self._add_wheel_tag(frame)
+        if load is None:
+            return
+        self._section_loaders.append(load)
+        self._run_loaders((load,))
+    
+    def _build_next_section(self):
+        """Build the next deferred section and reschedule while any remain."""
+        if not self._pending_sections:
+            return
+        build, load = self._pending_sections.pop(0)
+        self._realize_section(build, load)
+        if self._pending_sections:
+            self.safe_after_idle(self._build_next_section)
+    
+    def _create_section(self, parent, title):
+        """Create a styled section frame."""
+        frame = ttk.Labelframe(
+            parent,
+            text=title,
+            padding=15,
+            bootstyle="secondary"
         )
+        self._add_section_item(frame)
+        return frame
+    
+    def _add_section_item(self, frame, pad_top=0, pad_bottom=15):
+        """
+        Place a section frame in its own canvas window below the previous ones.
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor=NW, width=900) # Fixed width for consistency
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Helper to create styled sections
-        def create_section(parent, title):
-            frame = ttk.Labelframe(
-                parent,
-                text=title,
-                padding=15,
-                bootstyle="secondary"
-            )
-            frame.pack(fill=X, pady=(0, 15), anchor=NW)
-            return frame
-            
-        # Download Directory
-        dir_frame = create_section(scrollable_frame, "Download Directory")
+        Args:
+            frame: Section frame, a child of the canvas.
+            pad_top: Space above the section in pixels.
+            pad_bottom: Space below the section in pixels.
+        """
+        item_id = self._canvas.create_window(0, 0, window=frame, anchor=NW, width=self.SECTION_WIDTH)
+        self._section_items.append((item_id, frame, pad_top, pad_bottom))
+        frame.bind("<Configure>", self._on_section_configure)
+        
+        # A new section placed off screen gets no <Configure> until it is shown,
+        # so stack it once its requested size is known
+        self._schedule_layout()
+    
+    def _on_section_configure(self, event):
+        """Re-stack the sections when one of them changes size."""
+        self._schedule_layout()
+    
+    def _schedule_layout(self):
+        """
+        Run _layout_sections once the current burst of geometry changes is over.
+        
+        Every section fires <Configure> while the screen is laid out or the
+        window is resized; coalescing them into one trailing callback avoids a
+        full layout pass per event. An idle callback is not enough here, since
+        Tk goes idle between the events of a resize drag.
+        """
+        if self._layout_pending:
+            self.after_cancel(self._layout_pending)
+        self._layout_pending = self.safe_after(self.LAYOUT_DELAY_MS, self._layout_sections)
+    
+    def _layout_sections(self):
+        """Stack the section windows vertically and update the scroll region."""
+        self._layout_pending = None
+        y = 0
+        spans = []
+        for item_id, frame, pad_top, pad_bottom in self._section_items:
+            y += pad_top
+            height = frame.winfo_reqheight()
+            self._canvas.coords(item_id, 0, y)
+            spans.append((item_id, y, y + height))
+            y += height + pad_bottom
+        self._section_spans = spans
+        
+        # The extent is known from the layout pass, so no bbox("all") scan is needed
+        self._canvas.configure(scrollregion=(0, 0, self.SECTION_WIDTH, y))
+        self._update_visible_sections()
+    
+    def _on_canvas_scroll(self, first, last):
+        """Update the scrollbar and hide or show sections for the new view."""
+        self._scrollbar.set(first, last)
+        self._update_visible_sections()
+    
+    def _add_wheel_tag(self, widget):
+        """Give a widget and all of its descendants the mouse wheel bind tag."""
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            widget.bindtags((tags[0], self._wheel_tag) + tags[1:])
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+    
+    def _on_mousewheel(self, event):
+        """Handle mouse wheel scrolling."""
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            units = int(-1 * (event.delta / 120))
+        self._canvas.yview_scroll(units, "units")
+    
+    def _update_visible_sections(self):
+        """Hide sections that are more than SECTION_MARGIN pixels outside the view."""
+        canvas = self._canvas
+        view_top = canvas.canvasy(0)
+        top = view_top - self.SECTION_MARGIN
+        bottom = view_top + canvas.winfo_height() + self.SECTION_MARGIN
+        
+        for item_id, y0, y1 in self._section_spans:
+            visible = y1 >= top and y0 <= bottom
+            if visible and item_id in self._hidden_sections:
+                canvas.itemconfigure(item_id, state="normal")
+                self._hidden_sections.discard(item_id)
+            elif not visible and item_id not in self._hidden_sections:
+                canvas.itemconfigure(item_id, state="hidden")
+                self._hidden_sections.add(item_id)
+    
+    def _build_directory_section(self, parent):
+        """Build the download directory section."""
+        dir_frame = self._create_section(parent, "Download Directory")
         
         dir_input_frame = ttk.Frame(dir_frame)
         dir_input_frame.pack(fill=X)
         
         self.dir_entry = ttk.Entry(
             dir_input_frame,
-            font=("Consolas", 10),
+            textvariable=self._vars["download_directory"],
+            font=self._FONT_MONO,
         )
         self.dir_entry.pack(side=LEFT, fill=X, expand=YES, padx=(0, 10))
         
@@ -93,27 +370,29 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
             width=12
         )
         browse_btn.pack(side=LEFT)
-        
-        # Appearance
-        theme_frame = create_section(scrollable_frame, "Appearance")
+    
+    def _build_appearance_section(self, parent):
+        """Build the appearance section."""
+        theme_frame = self._create_section(parent, "Appearance")
         
         theme_row = ttk.Frame(theme_frame)
         theme_row.pack(fill=X)
         
-        ttk.Label(theme_row, text="Theme Mode:", font=("Segoe UI", 10)).pack(side=LEFT, padx=(0, 15))
+        ttk.Label(theme_row, text="Theme Mode:", style="Body.TLabel").pack(side=LEFT, padx=(0, 15))
         
-        self.theme_var = ttk.BooleanVar(value=True if self.app.theme_manager.get_current_theme() == "dark" else False)
+        self.theme_var = ttk.BooleanVar(value=self.app.theme_manager.get_current_theme() == "dark")
         self.theme_switch = ttk.Checkbutton(
             theme_row,
             text="Dark Mode",
             variable=self.theme_var,
             command=self.toggle_theme,
-            bootstyle="success-round-toggle"
+            bootstyle=self._TOGGLE
         )
         self.theme_switch.pack(side=LEFT)
-        
-        # Download Mode
-        mode_frame = create_section(scrollable_frame, "Download Behavior")
+    
+    def _build_mode_section(self, parent):
+        """Build the download behavior section."""
+        mode_frame = self._create_section(parent, "Download Behavior")
         
         self.mode_var = ttk.StringVar(value="sequential")
         
@@ -134,146 +413,132 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
             command=self.save_download_mode,
             bootstyle="success"
         ).pack(anchor=W, pady=2)
+    
+    def _build_proxy_section(self, parent):
+        """Build the network and proxy section."""
+        proxy_frame = self._create_section(parent, "Network & Proxy")
         
-        # Proxy Settings
-        proxy_frame = create_section(scrollable_frame, "Network & Proxy")
-        
-        self.proxy_enabled_var = ttk.BooleanVar(value=False)
         ttk.Checkbutton(
             proxy_frame,
             text="Enable Proxy",
-            variable=self.proxy_enabled_var,
-            command=self.save_proxy_settings,
-            bootstyle="success-round-toggle"
+            variable=self._vars["proxy_enabled"],
+            bootstyle=self._TOGGLE
         ).pack(anchor=W, pady=(0, 10))
         
-        # Grid for proxy details
+        # Grid for proxy details, only shown while the proxy is enabled
         proxy_grid = ttk.Frame(proxy_frame)
-        proxy_grid.pack(fill=X)
+        self._proxy_grid = proxy_grid
         
         ttk.Label(proxy_grid, text="Host:").grid(row=0, column=0, padx=5, pady=5, sticky=W)
-        self.proxy_host_entry = ttk.Entry(proxy_grid)
+        self.proxy_host_entry = ttk.Entry(proxy_grid, textvariable=self._vars["proxy_host"])
         self.proxy_host_entry.grid(row=0, column=1, padx=5, pady=5, sticky=EW)
         
         ttk.Label(proxy_grid, text="Port:").grid(row=0, column=2, padx=5, pady=5, sticky=W)
-        self.proxy_port_entry = ttk.Entry(proxy_grid, width=10)
+        self.proxy_port_entry = ttk.Entry(proxy_grid, textvariable=self._vars["proxy_port"], width=10)
         self.proxy_port_entry.grid(row=0, column=3, padx=5, pady=5, sticky=W)
         
         ttk.Label(proxy_grid, text="Type:").grid(row=0, column=4, padx=5, pady=5, sticky=W)
-        self.proxy_type_var = ttk.StringVar(value="http")
         ttk.Combobox(
             proxy_grid,
-            textvariable=self.proxy_type_var,
-            values=["http", "https", "socks5"],
+            textvariable=self._vars["proxy_type"],
+            values=self.PROXY_TYPES,
             state="readonly",
             width=10
         ).grid(row=0, column=5, padx=5, pady=5, sticky=W)
         
         proxy_grid.columnconfigure(1, weight=1)
         
-        # Additional Options
-        options_frame = create_section(scrollable_frame, "Advanced Options")
-        
-        self.subtitle_var = ttk.BooleanVar(value=False)
-        ttk.Checkbutton(
-            options_frame,
-            text="Download subtitles automatically",
-            variable=self.subtitle_var,
-            command=self.save_additional_options,
-            bootstyle="success-round-toggle"
-        ).pack(anchor=W, pady=5)
-        
-        self.notifications_var = ttk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            options_frame,
-            text="Show desktop notifications",
-            variable=self.notifications_var,
-            command=self.save_additional_options,
-            bootstyle="success-round-toggle"
-        ).pack(anchor=W, pady=5)
-        
-        self.auto_resume_var = ttk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            options_frame,
-            text="Auto-resume unfinished downloads",
-            variable=self.auto_resume_var,
-            command=self.save_additional_options,
-            bootstyle="success-round-toggle"
-        ).pack(anchor=W, pady=5)
-        
-        self.debug_mode_var = ttk.BooleanVar(value=False)
-        ttk.Checkbutton(
-            options_frame,
-            text="Debug Mode (Verbose Logging)",
-            variable=self.debug_mode_var,
-            command=self.save_additional_options,
-            bootstyle="warning-round-toggle"
-        ).pack(anchor=W, pady=5)
-
-        # ---------------------------------------------------------------------
-        # Advanced Features Section
-        # ---------------------------------------------------------------------
+        self._vars["proxy_enabled"].trace_add("write", self._toggle_proxy_grid)
+        # Every proxy field is saved through the debounced option queue;
+        # toggling the proxy also persists the host, port and type shown
+        for key in self._PROXY_KEYS:
+            self._track_option(key)
+        self._toggle_proxy_grid()
+    
+    def _build_options_section(self, parent):
+        """Build the advanced options section."""
+        self._build_checkbox_section(parent, "Advanced Options")
+    
+    def _build_checkbox_section(self, parent, title):
+        """
+        Build a section made only of option toggles from _CHECKBOX_SECTIONS.
         
-        # Audio Extraction
-        audio_frame = create_section(scrollable_frame, "Audio Extraction")
+        Args:
+            parent: Parent widget for the section.
+            title: Section title, also the key into _CHECKBOX_SECTIONS.
+        """
+        frame = self._create_section(parent, title)
+        pady, rows = self._CHECKBOX_SECTIONS[title]
+        for key, text, bootstyle in rows:
+            self._track_option(key)
+            ttk.Checkbutton(
+                frame,
+                text=text,
+                variable=self._vars[key],
+                bootstyle=bootstyle
+            ).pack(anchor=W, pady=pady)
+    
+    # -------------------------------------------------------------------------
+    # Advanced Features Sections
+    # -------------------------------------------------------------------------
+    
+    def _build_audio_section(self, parent):
+        """Build the audio extraction section."""
+        audio_frame = self._create_section(parent, "Audio Extraction")
         
-        self.extract_audio_var = ttk.BooleanVar(value=False)
+        self._track_option("extract_audio")
         ttk.Checkbutton(
             audio_frame,
             text="Extract Audio Only",
-            variable=self.extract_audio_var,
-            bootstyle="success-round-toggle"
+            variable=self._vars["extract_audio"],
+            bootstyle=self._TOGGLE
         ).pack(anchor=W, pady=(0, 5))
         
+        # Format options, only shown while audio extraction is enabled
         audio_opts = ttk.Frame(audio_frame)
-        audio_opts.pack(fill=X, padx=20)
+        self._audio_opts = audio_opts
         
         ttk.Label(audio_opts, text="Format:").pack(side=LEFT, padx=(0, 10))
-        self.audio_format_var = ttk.StringVar(value="mp3")
+        self._track_option("audio_format")
         ttk.Combobox(
             audio_opts,
-            textvariable=self.audio_format_var,
-            values=["mp3", "m4a", "wav", "flac"],
+            textvariable=self._vars["audio_format"],
+            values=self.AUDIO_FORMATS,
             state="readonly",
             width=10
         ).pack(side=LEFT)
         
-        # Post-Processing
-        post_frame = create_section(scrollable_frame, "Post-Processing")
-        
-        self.embed_thumb_var = ttk.BooleanVar(value=False)
-        ttk.Checkbutton(
-            post_frame,
-            text="Embed Thumbnail",
-            variable=self.embed_thumb_var,
-            bootstyle="success-round-toggle"
-        ).pack(anchor=W, pady=2)
-        
-        self.embed_meta_var = ttk.BooleanVar(value=False)
-        ttk.Checkbutton(
-            post_frame,
-            text="Embed Metadata",
-            variable=self.embed_meta_var,
-            bootstyle="success-round-toggle"
-        ).pack(anchor=W, pady=2)
-        
-        self.sponsor_var = ttk.BooleanVar(value=False)
-        ttk.Checkbutton(
-            post_frame,
-            text="Enable SponsorBlock (Skip Sponsors)",
-            variable=self.sponsor_var,
-            bootstyle="info-round-toggle"
-        ).pack(anchor=W, pady=2)
-        
-        # Authentication
-        auth_frame = create_section(scrollable_frame, "Authentication")
+        self._vars["extract_audio"].trace_add("write", self._toggle_audio_opts)
+        self._toggle_audio_opts()
+    
+    def _toggle_proxy_grid(self, *args):
+        """Show the proxy details only while the proxy is enabled."""
+        if self._vars["proxy_enabled"].get():
+            self._proxy_grid.pack(fill=X)
+        else:
+            self._proxy_grid.pack_forget()
+    
+    def _toggle_audio_opts(self, *args):
+        """Show the audio format options only while audio extraction is enabled."""
+        if self._vars["extract_audio"].get():
+            self._audio_opts.pack(fill=X, padx=20)
+        else:
+            self._audio_opts.pack_forget()
+    
+    def _build_post_section(self, parent):
+        """Build the post-processing section."""
+        self._build_checkbox_section(parent, "Post-Processing")
+    
+    def _build_auth_section(self, parent):
+        """Build the cookies authentication section."""
+        auth_frame = self._create_section(parent, "Authentication")
         
         ttk.Label(auth_frame, text="Cookies File (Netscape format):").pack(anchor=W, pady=(0, 5))
         
         auth_input = ttk.Frame(auth_frame)
         auth_input.pack(fill=X)
         
-        self.cookies_entry = ttk.Entry(auth_input)
+        self.cookies_entry = ttk.Entry(auth_input, textvariable=self._vars["cookies_path"])
         self.cookies_entry.pack(side=LEFT, fill=X, expand=YES, padx=(0, 10))
         
         ttk.Button(
@@ -283,32 +548,34 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
             bootstyle="secondary",
             width=10
         ).pack(side=LEFT)
-        
-        # OpenSubtitles Authentication
-        os_auth_frame = create_section(scrollable_frame, "OpenSubtitles.com Authentication")
+    
+    def _build_os_auth_section(self, parent):
+        """Build the OpenSubtitles authentication section."""
+        os_auth_frame = self._create_section(parent, "OpenSubtitles.com Authentication")
         
         ttk.Label(os_auth_frame, text="Username:").pack(anchor=W, pady=(0, 2))
-        self.os_user_entry = ttk.Entry(os_auth_frame)
+        self.os_user_entry = ttk.Entry(os_auth_frame, textvariable=self._vars["os_username"])
         self.os_user_entry.pack(fill=X, pady=(0, 10))
         
         ttk.Label(os_auth_frame, text="Password:").pack(anchor=W, pady=(0, 2))
-        self.os_pass_entry = ttk.Entry(os_auth_frame, show="*")
+        self.os_pass_entry = ttk.Entry(os_auth_frame, textvariable=self._vars["os_password"], show="*")
         self.os_pass_entry.pack(fill=X, pady=(0, 10))
         
         ttk.Label(os_auth_frame, text="API Key:").pack(anchor=W, pady=(0, 2))
-        self.os_api_entry = ttk.Entry(os_auth_frame)
+        self.os_api_entry = ttk.Entry(os_auth_frame, textvariable=self._vars["os_api_key"])
         self.os_api_entry.pack(fill=X, pady=(0, 5))
         
         ttk.Label(
             os_auth_frame, 
             text="Required for searching and downloading subtitles. Default key is provided.",
-            font=("Segoe UI", 8),
+            font=self._FONT_CAPTION,
             bootstyle="secondary"
         ).pack(anchor=W)
-        
-        # Action Buttons
-        button_frame = ttk.Frame(scrollable_frame)
-        button_frame.pack(fill=X, pady=(20, 0))
+    
+    def _build_buttons(self, parent):
+        """Build the action buttons."""
+        button_frame = ttk.Frame(parent)
+        self._add_section_item(button_frame, pad_top=20, pad_bottom=0)
         
         ttk.Button(
             button_frame,
@@ -326,76 +593,87 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
             width=20
         ).pack(side=LEFT)
         
-        # Pack layouts
-        canvas.pack(side=LEFT, fill=BOTH, expand=YES)
-        scrollbar.pack(side=RIGHT, fill=Y)
+        # Non-modal confirmation for actions such as resetting to defaults
+        self._status_label = ttk.Label(button_frame, text="", style="Status.TLabel")
+        self._status_label.pack(side=LEFT, padx=(15, 0))
+    
+    def _finish_loading(self):
+        """Load settings into the screen and enable saving."""
+        self.load_settings()
+        self.loading = False
     
     def load_settings(self):
-        """Load current settings into UI."""
-        settings = self.app.settings_manager
-        
-        # Download directory
-        self.dir_entry.delete(0, END)
-        self.dir_entry.insert(0, settings.get_download_directory())
-        
-        # Theme
-        theme = settings.get_theme()
-        self.theme_var.set(True if theme == "dark" else False)
-        
-        # Download mode
-        self.mode_var.set(settings.get_download_mode())
-        
-        # Proxy settings
-        self.proxy_enabled_var.set(settings.get("proxy_enabled", False))
-        self.proxy_host_entry.delete(0, END)
-        self.proxy_host_entry.insert(0, settings.get("proxy_host", ""))
-        self.proxy_port_entry.delete(0, END)
-        self.proxy_port_entry.insert(0, settings.get("proxy_port", ""))
-        self.proxy_type_var.set(settings.get("proxy_type", "http"))
-        
-        # Additional options
-        self.auto_resume_var.set(settings.get("auto_resume", True))
-        self.debug_mode_var.set(settings.get("debug_mode", False))
-        
-        # Load Advanced Settings
-        self.extract_audio_var.set(settings.get("extract_audio", False))
-        self.audio_format_var.set(settings.get("audio_format", "mp3"))
-        self.embed_thumb_var.set(settings.get("embed_thumbnail", False))
-        self.embed_meta_var.set(settings.get("embed_metadata", False))
-        self.sponsor_var.set(settings.get("sponsorblock_enabled", False))
-        self.cookies_entry.delete(0, END)
-        self.cookies_entry.insert(0, settings.get("cookies_path", ""))
-        self.os_user_entry.delete(0, END)
-        self.os_user_entry.insert(0, settings.get("os_username", ""))
-        self.os_pass_entry.delete(0, END)
-        self.os_pass_entry.insert(0, settings.get("os_password", ""))
-        self.os_api_entry.delete(0, END)
-        self.os_api_entry.insert(0, settings.get("os_api_key", ""))
+        """Load current settings into the sections built so far."""
+        # One snapshot for all loaders instead of a locked get() per key
+        settings = self.app.settings_manager.snapshot()
+        self._run_loaders((self._load_vars, *self._section_loaders), settings)
+    
+    def _run_loaders(self, loaders, settings=None):
+        """
+        Run section loaders with the loading guard set.
+        
+        Variable writes during population would otherwise fire the save
+        callbacks (toggle_theme, save_download_mode, tracked options) wired to
+        the widgets.
+        
+        Args:
+            loaders: Section loader methods to run.
+            settings: Settings snapshot to load from; taken now if omitted.
+        """
+        was_loading = self.loading
+        self.loading = True
+        try:
+            if settings is None:
+                settings = self.app.settings_manager.snapshot()
+            for load in loaders:
+                load(settings)
+        finally:
+            self.loading = was_loading
+    
+    def _set_var(self, key, value):
+        """Set a setting's variable, skipping the write (and its traces) when unchanged."""
+        var = self._vars[key]
+        if var.get() != value:
+            var.set(value)
+    
+    def _load_vars(self, settings):
+        """Load every setting bound to self._vars, built or not."""
+        for key, _, default in self._VAR_SPEC:
+            self._set_var(key, settings.get(key, default))
+    
+    def _load_appearance_section(self, settings):
+        """Load the theme."""
+        self.theme_var.set(settings["theme"] == "dark")
+    
+    def _load_mode_section(self, settings):
+        """Load the download mode."""
+        self.mode_var.set(settings["download_mode"])
     
     def browse_directory(self):
         """Open directory browser dialog."""
+        # Imported on first use so the screen doesn't load the dialog module
+        from tkinter import filedialog
+        
         directory = filedialog.askdirectory(
             title="Select Download Directory",
-            initialdir=self.dir_entry.get()
+            initialdir=self._vars["download_directory"].get()
         )
         
         if directory:
-            self.dir_entry.delete(0, END)
-            self.dir_entry.insert(0, directory)
-            self.app.settings_manager.set_download_directory(directory)
-            
-            # Publish SETTINGS_CHANGED event
-            self._publish_settings_changed(["download_directory"])
-            
+            self._set_var("download_directory", directory)
+            self._save_payload({"download_directory": directory})
+    
+
     def browse_cookies(self):
         """Open file browser for cookies."""
+        from tkinter import filedialog
+        
         filename = filedialog.askopenfilename(
             title="Select Cookies File",
             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
         )
         if filename:
-            self.cookies_entry.delete(0, END)
-            self.cookies_entry.insert(0, filename)
+            self._set_var("cookies_path", filename)
     
     def toggle_theme(self):
         """Toggle between dark and light themes."""
@@ -403,9 +681,6 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
             return
         new_theme = "dark" if self.theme_var.get() else "light"
         self.app.theme_manager.apply_theme(new_theme)
-        
-        # Publish SETTINGS_CHANGED event
-        self._publish_settings_changed(["theme"])
     
     def save_download_mode(self):
         """Save download mode setting."""
@@ -415,142 +690,130 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
         self.app.settings_manager.set_download_mode(mode)
         
         # Update download manager if it exists
-        if hasattr(self.app, 'download_manager'):
+        if self._dl_mgr is not None:
             try:
-                self.app.download_manager.set_download_mode(mode)
+                self._dl_mgr.set_download_mode(mode)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update download mode: {str(e)}")
+    
+    def _proxy_payload(self):
+        """Return the proxy settings currently shown in the form."""
+        return {key: self._vars[key].get() for key in self._PROXY_KEYS}
+    
+    def _options_payload(self):
+        """Return the additional options currently shown in the form."""
+        return {key: self._vars[key].get() for key in self._OPTION_KEYS}
+    
+    def _save_payload(self, payload):
+        """
+        Save the settings that changed in one update.
+        
+        SettingsManager.update() publishes SETTINGS_CHANGED for the keys it
+        wrote, so the screen does not publish its own event.
         
-        # Publish SETTINGS_CHANGED event
-        self._publish_settings_changed(["download_mode"])
+        Args:
+            payload: Mapping of setting keys to the values shown in the form.
+        
+        Returns:
+            dict: The subset of payload whose values differ from the saved ones.
+        """
+        before = self.app.settings_manager.snapshot()
+        changed = {key: value for key, value in payload.items() if before.get(key) != value}
+        if not changed:
+            return changed
+        
+        self.app.settings_manager.update(changed)
+        self._apply_runtime_options(changed)
+        return changed
     
-    def save_proxy_settings(self):
-        """Save proxy settings."""
-        if self.loading:
-            return
-        self.app.settings_manager.set("proxy_enabled", self.proxy_enabled_var.get())
-        self.app.settings_manager.set("proxy_host", self.proxy_host_entry.get())
-        self.app.settings_manager.set("proxy_port", self.proxy_port_entry.get())
-        self.app.settings_manager.set("proxy_type", self.proxy_type_var.get())
-        
-        # Publish SETTINGS_CHANGED event
-        self._publish_settings_changed(["proxy_enabled", "proxy_host", "proxy_port", "proxy_type"])
-    
-    def save_additional_options(self):
-        """Save additional options."""
-        self.app.settings_manager.set("subtitle_download", self.subtitle_var.get())
-        self.app.settings_manager.set("notifications_enabled", self.notifications_var.get())
-        self.app.settings_manager.set("auto_resume", self.auto_resume_var.get())
-        self.app.settings_manager.set("debug_mode", self.debug_mode_var.get())
-        
-        # Save Advanced Settings
-        self.app.settings_manager.set("extract_audio", self.extract_audio_var.get())
-        self.app.settings_manager.set("audio_format", self.audio_format_var.get())
-        self.app.settings_manager.set("embed_thumbnail", self.embed_thumb_var.get())
-        self.app.settings_manager.set("embed_metadata", self.embed_meta_var.get())
-        self.app.settings_manager.set("sponsorblock_enabled", self.sponsor_var.get())
-        self.app.settings_manager.set("cookies_path", self.cookies_entry.get())
-        self.app.settings_manager.set("os_username", self.os_user_entry.get())
-        self.app.settings_manager.set("os_password", self.os_pass_entry.get())
-        self.app.settings_manager.set("os_api_key", self.os_api_entry.get())
+    def _apply_runtime_options(self, values):
+        """
+        Push options that take effect immediately to the running application.
         
+        Args:
+            values: Saved option values; keys without a runtime effect are ignored.
+        """
         # Update debug mode
-        from utils import set_debug_mode
-        set_debug_mode(self.debug_mode_var.get())
+        if "debug_mode" in values:
+            set_debug_mode(values["debug_mode"])
         
         # Update download manager if it exists
-        if hasattr(self.app, 'download_manager'):
+        if "notifications_enabled" in values and self._dl_mgr is not None:
             try:
-                notifications_enabled = self.notifications_var.get()
-                self.app.download_manager.set_notifications_enabled(notifications_enabled)
-                
-                # Update advanced settings in download manager/video downloader
-                # For now just reload everything from settings in VideoDownloader
-                # But since we create VideoDownloader instances, we should pass config
-                pass 
-                
+                # Advanced settings are read from settings by each new VideoDownloader
+                self._dl_mgr.set_notifications_enabled(values["notifications_enabled"])
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update settings: {str(e)}")
+    
+    def _track_option(self, key):
+        """
+        Save an option automatically whenever its variable is written.
         
-        # Publish SETTINGS_CHANGED event
-        changed_keys = [
-            "subtitle_download", "notifications_enabled", "auto_resume", "debug_mode",
-            "extract_audio", "audio_format", "embed_thumbnail", "embed_metadata",
-            "sponsorblock_enabled", "cookies_path", "os_username", "os_password", "os_api_key"
-        ]
-        self._publish_settings_changed(changed_keys)
+        Args:
+            key: Settings key of the variable in self._vars.
+        """
+        self._vars[key].trace_add("write", lambda *args, k=key: self._queue_save(k))
+    
+    def _queue_save(self, key):
+        """Record a changed option and (re)start the save timer."""
+        if self.loading:
+            return
+        # The proxy is saved as a unit; _save_payload drops unchanged values
+        keys = self._PROXY_KEYS if key in self._PROXY_KEYS else (key,)
+        for k in keys:
+            self._dirty[k] = self._vars[k].get()
+        self._cancel_pending_save()
+        self._save_after_id = self.safe_after(self.SAVE_DELAY_MS, self._flush_dirty)
+    
+    def _cancel_pending_save(self):
+        """Cancel the save timer if one is running."""
+        if self._save_after_id:
+            try:
+                self.after_cancel(self._save_after_id)
+            except Exception:
+                pass
+            self._save_after_id = None
+    
+    def _flush_dirty(self):
+        """Save every option changed since the last flush in one settings update."""
+        self._save_after_id = None
+        dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+        
+        self._save_payload(dirty)
     
     def save_all_settings(self):
         """Save all settings."""
-        # Save download directory
-        directory = self.dir_entry.get()
+        # Merge every section into one payload so the file is written once
+        payload = {**self._proxy_payload(), **self._options_payload()}
+        directory = self._vars["download_directory"].get()
         if directory:
-            self.app.settings_manager.set_download_directory(directory)
-        
-        # Save proxy settings
-        self.save_proxy_settings()
-        
-        # Save additional options (includes advanced)
-        self.save_additional_options()
+            payload["download_directory"] = directory
         
-        # Publish SETTINGS_CHANGED event for all settings
-        changed_keys = [
-            "download_directory", "proxy_enabled", "proxy_host", "proxy_port", "proxy_type",
-            "subtitle_download", "notifications_enabled", "auto_resume", "debug_mode",
-            "extract_audio", "audio_format", "embed_thumbnail", "embed_metadata",
-            "sponsorblock_enabled", "cookies_path", "os_username", "os_password", "os_api_key"
-        ]
-        self._publish_settings_changed(changed_keys)
+        self._save_payload(payload)
         
         messagebox.showinfo("Success", "All settings saved successfully!")
     
     def reset_to_defaults(self):
         """Reset all settings to defaults."""
         if messagebox.askyesno("Confirm", "Reset all settings to defaults?"):
+            # Drop toggles still waiting to be saved so they don't overwrite the defaults
+            self._cancel_pending_save()
+            self._dirty.clear()
+            
+            # Reload values into the existing widgets; the widget tree is never rebuilt
             self.app.settings_manager.reset_to_defaults()
             self.load_settings()
             
-            # Publish SETTINGS_CHANGED event for all settings
-            self._publish_settings_changed(["all"])
-            
-            messagebox.showinfo("Success", "Settings reset to defaults")
+            # Confirm without a second modal dialog
+            self.bell()
+            self._status_label.config(text="Defaults restored")
+            self.safe_after(2000, self._clear_status)
     
-    def _publish_settings_changed(self, changed_keys):
-        """
-        Publish SETTINGS_CHANGED event to EventBus.
-        
-        Args:
-            changed_keys: List of setting keys that changed
-        """
-        if self.event_bus:
-            try:
-                # Get current values for changed settings
-                settings = {}
-                for key in changed_keys:
-                    if key == "all":
-                        # For reset to defaults, indicate all settings changed
-                        settings = {"reset": True}
-                        break
-                    elif key == "theme":
-                        settings[key] = self.app.theme_manager.get_current_theme()
-                    elif key == "download_mode":
-                        settings[key] = self.app.settings_manager.get_download_mode()
-                    elif key == "download_directory":
-                        settings[key] = self.app.settings_manager.get_download_directory()
-                    else:
-                        settings[key] = self.app.settings_manager.get(key)
-                
-                event = Event(
-                    type=EventType.SETTINGS_CHANGED,
-                    data={
-                        "changed_keys": changed_keys,
-                        "settings": settings
-                    }
-                )
-                self.event_bus.publish(event)
-                self.logger.debug(f"Published SETTINGS_CHANGED event for keys: {changed_keys}")
-            except Exception as e:
-                self.logger.error(f"Error publishing SETTINGS_CHANGED event: {e}", exc_info=True)
+    def _clear_status(self):
+        """Clear the non-modal status message."""
+        self._status_label.config(text="")
     
     def cleanup(self):
         """
@@ -562,14 +825,21 @@ class SettingsScreen(SafeCallbackMixin, ttk.Frame):
         """
         self.logger.info("Cleaning up SettingsScreen")
         
+        # Don't lose toggles still waiting for the save timer
+        self._cancel_pending_save()
+        self._flush_dirty()
+        
+        if self._layout_pending:
+            self.after_cancel(self._layout_pending)
+            self._layout_pending = None
+        
         # Unsubscribe from all events
-        if self.event_bus:
-            for sub_id in self._subscription_ids:
-                try:
-                    self.event_bus.unsubscribe(sub_id)
-                    self.logger.debug(f"Unsubscribed from event with ID {sub_id}")
-                except Exception as e:
-                    self.logger.error(f"Error unsubscribing from event {sub_id}: {e}")
+        if self.event_bus and self._subscription_ids:
+            try:
+                removed = self.event_bus.unsubscribe_many(self._subscription_ids)
+                self.logger.debug(f"Unsubscribed from {removed} event(s)")
+            except Exception as e:
+                self.logger.error(f"Error unsubscribing from events: {e}")
             self._subscription_ids.clear()
         
         # Cleanup callbacks from SafeCallbackMixin
@@ -7,17 +7,34 @@ import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from tkinter import filedialog, messagebox
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
+from types import MappingProxyType
 import os
+import shutil
 import sys
 
 import subliminal
 from babelfish import Language
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from utils.logger import get_logger
 
 
 class SubtitlesScreen(ttk.Frame):
     """Screen for downloading subtitles using OpenSubtitles.com."""
     
+    # Manual search results are reused for identical (account, query, language) searches
+    SEARCH_CACHE_SIZE = 64
+    SEARCH_CACHE_TTL = 600  # seconds
+    
+    # Scanned videos are reused while the file's size and mtime are unchanged
+    SCAN_CACHE_SIZE = 32
+    
     def __init__(self, parent, app):
         """
         Initialize SubtitlesScreen.
@@ -28,11 +45,25 @@ class SubtitlesScreen(ttk.Frame):
         """
         super().__init__(parent)
         self.app = app
+        self.logger = get_logger()
         self.selected_file = None
         self.is_searching = False
+        self._searching_lock = threading.Lock()  # Guards the is_searching check-and-set
+        self._search_debounce = None  # Pending Return-key search callback
         self.search_results = []
+        self._os_provider = None  # Logged-in provider shared by search and download
+        self._os_provider_key = None  # Credentials _os_provider was created with
+        self._os_provider_lock = threading.Lock()
+        self._os_provider_users = {}  # id(provider) -> number of workers using it
+        self._retired_os_providers = {}  # id(provider) -> replaced provider still in use
+        self._search_cache = OrderedDict()  # (username, query, languages) -> (timestamp, results)
+        self._search_cache_lock = threading.Lock()
+        self._scan_cache = OrderedDict()  # (path, size, mtime_ns) -> scanned Video
+        self._scan_cache_lock = threading.Lock()
+        # Hashing reads megabytes per file; cap how many scans run at once
+        self._scan_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="subtitle-scan")
         self.manual_save_dir = str(Path.home() / "Downloads" / "Klyp")
-        self.languages_dict = {
+        self.languages_dict = MappingProxyType({
             "English": "eng",
             "Spanish": "spa",
             "French": "fra",
@@ -43,7 +74,8 @@ class SubtitlesScreen(ttk.Frame):
             "Japanese": "jpn",
             "Chinese": "zho",
             "Korean": "kor"
-        }
+        })
+        self._lang_names = tuple(self.languages_dict)  # Shared combobox values
         self.patch_subliminal()
         self.setup_ui()
 
@@ -61,7 +93,22 @@ class SubtitlesScreen(ttk.Frame):
             original_os_init = OpenSubtitlesComProvider.initialize
             def patched_os_init(instance):
                 original_os_init(instance)
-                # Ensure Accept is application/json
+                # Pool connections (the cached provider keeps them alive between
+                # actions) and retry idempotent GETs on transient failures
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=16,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=['GET']
+                    )
+                )
+                instance.session.mount('https://', adapter)
+                instance.session.mount('http://', adapter)
+                # Ensure Accept is application/json; requests already sends
+                # gzip/deflate Accept-Encoding and keep-alive by default
                 instance.session.headers['Accept'] = 'application/json'
             
             OpenSubtitlesComProvider.initialize = patched_os_init
@@ -105,6 +152,34 @@ class SubtitlesScreen(ttk.Frame):
                     raise
             
             OpenSubtitlesComProvider._search = patched_os_search
+
+            # 4. Streamed download: copy the subtitle file from the socket to disk
+            # instead of holding the whole payload in memory
+            def download_to_file(instance, subtitle, path):
+                # Ask for SRT so the content matches the .srt name it is saved under
+                ret = instance.api_post('download', {'file_id': subtitle.file_id, 'sub_format': 'srt'})
+                link = ret.get('link') if isinstance(ret, dict) else None
+                if not link:
+                    raise ValueError("OpenSubtitles.com returned no download link")
+                # Stream into a temporary file next to the target so a dropped
+                # connection never leaves a truncated subtitle behind
+                part_path = f"{path}.part"
+                try:
+                    with instance.session.get(link, stream=True, timeout=instance.timeout) as r:
+                        r.raise_for_status()
+                        # Let urllib3 undo gzip/deflate transfer encoding while copying
+                        r.raw.decode_content = True
+                        with open(part_path, 'wb') as f:
+                            shutil.copyfileobj(r.raw, f, length=65536)
+                    os.replace(part_path, path)
+                except BaseException:
+                    try:
+                        os.unlink(part_path)
+                    except OSError:
+                        pass
+                    raise
+
+            OpenSubtitlesComProvider.klyp_download_to_file = download_to_file
             print("DEBUG: OpenSubtitles.com patched successfully.")
             
         except Exception as e:
@@ -177,7 +252,7 @@ class SubtitlesScreen(ttk.Frame):
         self.local_lang_combo = ttk.Combobox(
             opt_frame, 
             textvariable=self.local_lang_var, 
-            values=list(self.languages_dict.keys()),
+            values=self._lang_names,
             state="readonly",
             width=15
         )
@@ -208,7 +283,7 @@ class SubtitlesScreen(ttk.Frame):
         ttk.Label(search_input_frame, text="Title/Series:").pack(side=LEFT, padx=(0, 10))
         self.search_entry = ttk.Entry(search_input_frame)
         self.search_entry.pack(side=LEFT, fill=X, expand=YES, padx=(0, 10))
-        self.search_entry.bind("<Return>", lambda e: self.start_manual_search())
+        self.search_entry.bind("<Return>", self._debounced_manual_search)
 
         self.search_manual_btn = ttk.Button(
             search_input_frame, 
@@ -234,7 +309,7 @@ class SubtitlesScreen(ttk.Frame):
         self.lang_combo = ttk.Combobox(
             opt_frame, 
             textvariable=self.manual_lang_var, 
-            values=list(self.languages_dict.keys()),
+            values=self._lang_names,
             state="readonly",
             width=15
         )
@@ -326,6 +401,88 @@ class SubtitlesScreen(ttk.Frame):
         api_key = self.app.settings_manager.get("os_api_key", "")
         return username, password, api_key
 
+    @contextmanager
+    def _os_provider_session(self, user, pwd, key):
+        """
+        Use the logged-in OpenSubtitles.com provider for these credentials.
+        
+        The provider is reused while the credentials stay the same, so only
+        the first search or download pays for the login round-trip. If the
+        block raises (e.g. an expired token), the provider is dropped so the
+        next action logs in again.
+        """
+        provider = self._acquire_os_provider(user, pwd, key)
+        try:
+            yield provider
+        except Exception:
+            self._discard_os_provider(provider)
+            raise
+        finally:
+            self._release_os_provider(provider)
+
+    def _acquire_os_provider(self, user, pwd, key):
+        """Return the cached provider for these credentials, logging in if needed."""
+        from subliminal.providers.opensubtitlescom import OpenSubtitlesComProvider
+        
+        with self._os_provider_lock:
+            if self._os_provider is None or self._os_provider_key != (user, pwd, key):
+                if self._os_provider is not None:
+                    self._retire_os_provider(self._os_provider)
+                provider = OpenSubtitlesComProvider(user, pwd, apikey=key)
+                provider.initialize()
+                self._os_provider = provider
+                self._os_provider_key = (user, pwd, key)
+            provider = self._os_provider
+            self._os_provider_users[id(provider)] = self._os_provider_users.get(id(provider), 0) + 1
+            return provider
+
+    def _release_os_provider(self, provider):
+        """Finish one use of a provider, terminating it if it was retired meanwhile."""
+        with self._os_provider_lock:
+            users = self._os_provider_users.get(id(provider), 1) - 1
+            if users > 0:
+                self._os_provider_users[id(provider)] = users
+                return
+            self._os_provider_users.pop(id(provider), None)
+            if self._retired_os_providers.pop(id(provider), None) is not None:
+                self._terminate_os_provider(provider)
+
+    def _discard_os_provider(self, provider):
+        """Stop handing out a provider whose session may be broken."""
+        with self._os_provider_lock:
+            if self._os_provider is provider:
+                self._os_provider = None
+                self._os_provider_key = None
+                self._retire_os_provider(provider)
+
+    def _retire_os_provider(self, provider):
+        """Terminate a provider now, or once the workers still using it finish."""
+        if self._os_provider_users.get(id(provider)):
+            self._retired_os_providers[id(provider)] = provider
+        else:
+            self._terminate_os_provider(provider)
+
+    @staticmethod
+    def _terminate_os_provider(provider):
+        """Log out of a provider session."""
+        try:
+            provider.terminate()
+        except Exception as e:
+            get_logger().warning(f"OpenSubtitles provider terminate failed: {e}")
+
+    def shutdown(self):
+        """Release the provider sessions and scan pool; called on application exit."""
+        with self._os_provider_lock:
+            providers = list(self._retired_os_providers.values())
+            if self._os_provider is not None:
+                providers.append(self._os_provider)
+            self._os_provider = None
+            self._os_provider_key = None
+            self._retired_os_providers.clear()
+            for provider in providers:
+                self._terminate_os_provider(provider)
+        self._scan_pool.shutdown(wait=False)
+
     def start_local_download(self):
         """Start file-based subtitle search."""
         if not self.selected_file:
@@ -334,8 +491,7 @@ class SubtitlesScreen(ttk.Frame):
             
         creds = self._get_credentials()
         
-        if self.is_searching: return
-        self._set_loading(True)
+        if not self._begin_search(): return
         self.status_label.config(text="Scanning video and searching...", bootstyle="info")
         
         lang_code = self.languages_dict.get(self.local_lang_var.get(), "eng")
@@ -346,14 +502,18 @@ class SubtitlesScreen(ttk.Frame):
         try:
             lang_codes = [l.strip() for l in lang_str.split(',') if l.strip()]
             languages = {Language(l) for l in lang_codes}
-            video = subliminal.scan_video(video_path)
+            video = self._scan_video(video_path)
             
             configs = {'opensubtitlescom': {'username': user, 'password': pwd, 'apikey': key}}
+            
+            # One call for every language: each download_best_subtitles call
+            # opens its own ProviderPool and logs in again
             subtitles = subliminal.download_best_subtitles([video], languages, provider_configs=configs)
+            found = subtitles.get(video, [])
             
-            if video in subtitles and subtitles[video]:
-                subliminal.save_subtitles(video, subtitles[video])
-                self._update_status(f"Successfully downloaded {len(subtitles[video])} subtitle(s)!", "success")
+            if found:
+                subliminal.save_subtitles(video, found)
+                self._update_status(f"Successfully downloaded {len(found)} subtitle(s)!", "success")
             else:
                 self._update_status("No matching subtitles found for this file.", "warning")
         except Exception as e:
@@ -361,6 +521,36 @@ class SubtitlesScreen(ttk.Frame):
         finally:
             self._on_finish()
 
+    def _begin_search(self):
+        """Atomically claim the searching state; returns False if a search is running."""
+        with self._searching_lock:
+            if self.is_searching:
+                return False
+            self.is_searching = True
+        self._set_loading(True)
+        return True
+
+    def _debounced_manual_search(self, event=None):
+        """Coalesce bursts of Return presses into one search 250ms after the last."""
+        if self._search_debounce is not None:
+            self.after_cancel(self._search_debounce)
+        self._search_debounce = self.after(250, self._fire_manual_search)
+
+    def _fire_manual_search(self):
+        """Run the search scheduled by _debounced_manual_search."""
+        self._search_debounce = None
+        self.start_manual_search()
+
+    def destroy(self):
+        """Cancel a pending debounced search before the widget goes away."""
+        if self._search_debounce is not None:
+            try:
+                self.after_cancel(self._search_debounce)
+            except Exception:
+                pass
+            self._search_debounce = None
+        super().destroy()
+
     def start_manual_search(self):
         """Start title-based subtitle search."""
         query = self.search_entry.get().strip()
@@ -369,8 +559,7 @@ class SubtitlesScreen(ttk.Frame):
             
         creds = self._get_credentials()
         
-        if self.is_searching: return
-        self._set_loading(True)
+        if not self._begin_search(): return
         self.tree.delete(*self.tree.get_children())
         self.search_results = []
         self.status_label.config(text=f"Searching for '{query}'...", bootstyle="info")
@@ -387,7 +576,6 @@ class SubtitlesScreen(ttk.Frame):
         """Worker for title search using OpenSubtitles.com."""
         try:
             from subliminal.video import Movie
-            from subliminal.providers.opensubtitlescom import OpenSubtitlesComProvider
             
             lang_codes = [l.strip() for l in lang_str.split(',') if l.strip()]
             languages = {Language(l) for l in lang_codes}
@@ -397,14 +585,28 @@ class SubtitlesScreen(ttk.Frame):
             
             all_results = []
             
-            if user and pwd:
+            # Cached results belong to the account that fetched them and are
+            # only served while that account's credentials are still set
+            cache_key = (user, query.lower(), lang_str)
+            cached = self._get_cached_search(cache_key) if user and pwd else None
+            if cached is not None:
+                self.logger.debug(f"Reusing cached subtitle results for '{query}'")
+                all_results.extend(cached)
+            elif user and pwd:
                 print(f"DEBUG: Searching OpenSubtitles.com for '{query}'...")
                 try:
-                    os_provider = OpenSubtitlesComProvider(user, pwd, apikey=key)
-                    os_provider.initialize()
-                    os_results = os_provider.list_subtitles(video, languages)
-                    print(f"DEBUG: OpenSubtitles.com found {len(os_results)} subtitles.")
-                    all_results.extend(os_results)
+                    # Query each language in parallel on the one logged-in provider
+                    with self._os_provider_session(user, pwd, key) as os_provider, \
+                            ThreadPoolExecutor(max_workers=min(8, len(languages)) or 1) as executor:
+                        futures = [
+                            executor.submit(os_provider.list_subtitles, video, {lang})
+                            for lang in languages
+                        ]
+                        for future in as_completed(futures):
+                            all_results.extend(future.result())
+                    print(f"DEBUG: OpenSubtitles.com found {len(all_results)} subtitles.")
+                    if all_results:
+                        self._cache_search(cache_key, all_results)
                 except Exception as e:
                     print(f"ERROR: OpenSubtitles manual search failed: {str(e)}")
                     if hasattr(self.app, 'logger'):
@@ -421,22 +623,69 @@ class SubtitlesScreen(ttk.Frame):
         finally:
             self._on_finish()
 
+    def _scan_video(self, video_path):
+        """Scan a video on the scan pool, reusing the result while the file is unchanged."""
+        st = os.stat(video_path)
+        cache_key = (video_path, st.st_size, st.st_mtime_ns)
+        with self._scan_cache_lock:
+            video = self._scan_cache.get(cache_key)
+            if video is not None:
+                self._scan_cache.move_to_end(cache_key)
+                return video
+        
+        video = self._scan_pool.submit(subliminal.scan_video, video_path).result()
+        
+        with self._scan_cache_lock:
+            self._scan_cache[cache_key] = video
+            while len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+        return video
+
+    def _get_cached_search(self, cache_key):
+        """Return cached results for a search, or None if missing or expired."""
+        with self._search_cache_lock:
+            entry = self._search_cache.get(cache_key)
+            if entry is None:
+                return None
+            timestamp, results = entry
+            if time.monotonic() - timestamp > self.SEARCH_CACHE_TTL:
+                del self._search_cache[cache_key]
+                return None
+            self._search_cache.move_to_end(cache_key)
+            return results
+
+    def _cache_search(self, cache_key, results):
+        """Store search results, evicting the least recently used entry when full."""
+        with self._search_cache_lock:
+            self._search_cache[cache_key] = (time.monotonic(), list(results))
+            self._search_cache.move_to_end(cache_key)
+            while len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
     def _populate_results(self, results):
         """Populate Treeview with results."""
-        self.tree.delete(*self.tree.get_children())
-        for i, sub in enumerate(results):
-            # Resilient attribute access
-            lang = getattr(sub, 'language', 'N/A')
-            provider = getattr(sub, 'provider_name', 'N/A')
-            fname = getattr(sub, 'filename', getattr(sub, 'file_name', 'N/A'))
-            sub_id = getattr(sub, 'id', getattr(sub, 'subtitle_id', 'N/A'))
-            
-            self.tree.insert("", END, iid=str(i), values=(
-                lang, 
-                provider, 
-                fname, 
-                sub_id
+        tree = self.tree
+        tree.delete(*tree.get_children())
+        
+        # Build every row first (resilient attribute access) so the insert
+        # loop below only talks to Tk
+        rows = [
+            (str(i), (
+                getattr(sub, 'language', 'N/A'),
+                getattr(sub, 'provider_name', 'N/A'),
+                getattr(sub, 'filename', getattr(sub, 'file_name', 'N/A')),
+                getattr(sub, 'id', getattr(sub, 'subtitle_id', 'N/A'))
             ))
+            for i, sub in enumerate(results)
+        ]
+        
+        # Hide the columns while inserting to skip per-row redraws
+        tree.configure(displaycolumns=())
+        try:
+            for iid, values in rows:
+                tree.insert("", END, iid=iid, values=values)
+        finally:
+            tree.configure(displaycolumns="#all")
         self.download_manual_btn.config(state=NORMAL if results else DISABLED)
 
     def download_selected_manual(self):
@@ -456,23 +705,30 @@ class SubtitlesScreen(ttk.Frame):
     def _manual_download_worker(self, subtitle, user, pwd, key):
         """Worker for manual download with OpenSubtitles.com."""
         try:
-            from subliminal.providers.opensubtitlescom import OpenSubtitlesComProvider
-            
             print(f"DEBUG: Starting download from OpenSubtitles.com")
-            provider = OpenSubtitlesComProvider(user, pwd, apikey=key)
-                
-            provider.initialize()
-            content = provider.get_subtitle_content(subtitle)
             
             # Save to disk
             ext = ".srt"
             filename = getattr(subtitle, 'filename', getattr(subtitle, 'file_name', f"subtitle_{getattr(subtitle, 'id', 'new')}"))
-            if not filename.endswith(ext): filename += ext
             
-            save_path = os.path.join(self.manual_save_dir, filename)
+            # Keep only the name part of the provider-supplied filename and make
+            # sure the result still lands inside the save directory
+            base = Path(self.manual_save_dir).resolve()
+            name = Path(filename).name
+            if not name.endswith(ext):
+                name += ext
+            save_path = (base / name).resolve()
+            if save_path.parent != base:
+                raise ValueError(f"Unsafe subtitle filename: {filename}")
+            filename = name
             print(f"DEBUG: Saving subtitle to: {save_path}")
-            with open(save_path, 'wb') as f:
-                f.write(content)
+            with self._os_provider_session(user, pwd, key) as provider:
+                if hasattr(provider, 'klyp_download_to_file'):
+                    provider.klyp_download_to_file(subtitle, save_path)
+                else:
+                    # patch_subliminal failed; fall back to the buffered download
+                    with save_path.open('wb') as f:
+                        f.write(provider.get_subtitle_content(subtitle))
             
             self._update_status(f"Saved: {filename}", "success")
             print(f"DEBUG: Download successful: {filename}")